@@ -5,13 +5,14 @@ from typing import TYPE_CHECKING
 
 from discord.app_commands import Choice, Transformer
 from discord.ext import commands
-from redbot.core.i18n import Translator
 
 from pylav.exceptions import EntryNotFoundError
 from pylav.types import InteractionT
 from pylav.utils import PyLavContext
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 if TYPE_CHECKING:
     BassBoostConverter = str
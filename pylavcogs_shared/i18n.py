@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Mapping
+from pathlib import Path
+
+from red_commons.logging import getLogger
+from redbot.core.i18n import Translator, get_locale
+
+from pylavcogs_shared.utils.catalogs import MoCatalog, po_digest, read_po
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.i18n")
+
+
+class CatalogStore:
+    """The translation catalogs of every :class:`SharedTranslator`, keyed by locales folder and locale.
+
+    Catalogs are only loaded the first time a string is translated for their locale,
+    the compiled ``.mo`` file is used when it was compiled from the current ``.po`` file, otherwise that is parsed.
+    """
+
+    __slots__ = ("_catalogs",)
+
+    def __init__(self) -> None:
+        self._catalogs: dict[tuple[Path, str], Mapping[str, str]] = {}
+
+    def get(self, folder: Path, locale: str) -> Mapping[str, str]:
+        if (catalog := self._catalogs.get((folder, locale))) is None:
+            catalog = self._catalogs[(folder, locale)] = self._load(folder, locale)
+        return catalog
+
+    @staticmethod
+    def _load(folder: Path, locale: str) -> Mapping[str, str]:
+        po_file = folder / "locales" / f"{locale}.po"
+        mo_file = po_file.with_suffix(".mo")
+        with contextlib.suppress(OSError, ValueError):
+            catalog = MoCatalog(mo_file)
+            # Compared by content rather than modification time, which isn't kept when a wheel is installed
+            if not po_file.exists() or catalog.source_digest == po_digest(po_file):
+                return catalog
+            catalog.close()
+        with contextlib.suppress(OSError):
+            return read_po(po_file)
+        LOGGER.trace("No %s translations found in %s", locale, folder)
+        return {}
+
+    def clear(self) -> None:
+        for catalog in self._catalogs.values():
+            if isinstance(catalog, MoCatalog):
+                catalog.close()
+        self._catalogs.clear()
+
+    def __len__(self) -> int:
+        return len(self._catalogs)
+
+
+CATALOG_STORE = CatalogStore()
+
+
+class SharedTranslator(Translator):
+    """A Red :class:`Translator` backed by the process-wide :data:`CATALOG_STORE`.
+
+    Every translator pointing at the same locales folder shares a single catalog per locale,
+    rather than each parsing and holding its own copy of every ``.po`` file it's used with.
+    """
+
+    def __call__(self, untranslated: str) -> str:
+        locale = get_locale()
+        if locale.lower() == "en-us":
+            return untranslated
+        return CATALOG_STORE.get(self.cog_folder, locale).get(untranslated, untranslated)
+
+    def load_translations(self) -> None:
+        # Red calls this on every translator for each message it sets the contextual locale for,
+        # the catalogs are loaded by the store on first use, so there is nothing to do here.
+        pass
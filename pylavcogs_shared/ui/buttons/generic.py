@@ -5,12 +5,13 @@ from pathlib import Path
 from typing import Callable
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.types import CogT, InteractionT
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class NavigateButton(discord.ui.Button):
@@ -168,6 +169,9 @@ class RefreshButton(discord.ui.Button):
         self.cog = cog
 
     async def callback(self, interaction: InteractionT):
+        self.view.clear_prefetched()
+        if hasattr(self.view.source, "invalidate"):
+            self.view.source.invalidate()
         await self.view.prepare()
         kwargs = await self.view.get_page(self.view.current_page)
         await interaction.response.edit_message(view=self.view, **kwargs)
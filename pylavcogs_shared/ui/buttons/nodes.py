@@ -7,18 +7,19 @@ import asyncstdlib
 import discord
 from discord import Emoji, PartialEmoji
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
+
 if TYPE_CHECKING:
-    from pylavcogs_shared.ui.menus.nodes import AddNodeFlow, NodeManagerMenu
+    from pylavcogs_shared.ui.menus.nodes import AddNodeFlow, NodeManagerMenu, NodeProbeMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.button.nodes")
 
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class SSLNodeToggleButton(discord.ui.Button):
@@ -257,3 +258,40 @@ class NodeShowEnabledSourcesButton(discord.ui.Button):
             ),
             ephemeral=True,
         )
+
+
+class ProbeNodesButton(discord.ui.Button):
+    view: NodeManagerMenu | NodeProbeMenu
+
+    def __init__(self, cog: CogT, style: discord.ButtonStyle, row: int = None):
+        super().__init__(
+            style=style,
+            emoji="\N{SATELLITE ANTENNA}",
+            row=row,
+        )
+        self.cog = cog
+
+    async def callback(self, interaction: InteractionT):
+        if not interaction.response.is_done():
+            await interaction.response.defer(ephemeral=True)
+        context = await self.cog.bot.get_context(interaction)
+        if self.view.author.id != interaction.user.id:
+            return await context.send(
+                embed=await self.cog.lavalink.construct_embed(
+                    messageable=interaction, description=_("You are not authorized to interact with this option")
+                ),
+                ephemeral=True,
+            )
+        from pylavcogs_shared.ui.menus.nodes import NodeProbeMenu
+        from pylavcogs_shared.ui.sources.nodes import NodeProbeSource
+
+        if isinstance(self.view, NodeProbeMenu):
+            self.view.source.invalidate()
+            await self.view.show_page(0, interaction)
+            return
+        await NodeProbeMenu(
+            cog=self.cog,
+            bot=self.cog.bot,
+            source=NodeProbeSource(cog=self.cog),
+            original_author=interaction.user,
+        ).start(context)
@@ -5,13 +5,14 @@ from pathlib import Path
 from typing import Literal
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.types import CogT, InteractionT
 from pylav.utils import AsyncIter
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class DisconnectButton(discord.ui.Button):
@@ -1,27 +1,26 @@
 from __future__ import annotations
 
 import contextlib
-import itertools
-from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
 import discord
 from discord import Emoji, PartialEmoji
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.sql.models import PlaylistModel
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.modals.playlist import PlaylistSaveModal
 from pylavcogs_shared.ui.selectors.playlist import PlaylistPlaySelector
 from pylavcogs_shared.utils import rgetattr
+from pylavcogs_shared.utils.playlists import export_playlist
 
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.playlist import PlaylistCreationFlow, PlaylistManageFlow
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlaylistDeleteButton(discord.ui.Button):
@@ -122,8 +121,7 @@ class PlaylistDownloadButton(discord.ui.Button):
                 ),
                 ephemeral=True,
             )
-        async with self.view.playlist.to_yaml(guild=interaction.guild) as (yaml_file, compressed):
-            yaml_file: BytesIO
+        async with export_playlist(self.view.playlist, guild=interaction.guild) as (yaml_file, compressed):
             await context.send(
                 embed=await self.cog.lavalink.construct_embed(
                     messageable=interaction,
@@ -228,6 +226,7 @@ class PlaylistInfoButton(discord.ui.Button):
             delete_after_timeout=True,
             starting_page=0,
             original_author=interaction.user,
+            prefetch=True,
         ).start(context)
 
 
@@ -386,24 +385,29 @@ class EnqueuePlaylistButton(discord.ui.Button):
             await interaction.response.defer(ephemeral=True)
         context = await self.cog.bot.get_context(interaction)
         if not self.playlist:
-            playlists = await self.cog.lavalink.playlist_db_manager.get_all_for_user(
-                requester=context.author.id,
-                vc=rgetattr(context.author, "voice.channel", None),
-                guild=context.guild,
-                channel=context.channel,
-            )
-            playlists = list(itertools.chain.from_iterable(playlists))
+            # The same scopes PlaylistManager.get_all_for_user looks in
+            scopes = [
+                scope.id
+                for scope in (
+                    self.cog.bot.user,
+                    context.author,
+                    context.guild,
+                    context.channel,
+                    rgetattr(context.author, "voice.channel", None),
+                )
+                if scope is not None
+            ]
             from pylavcogs_shared.ui.menus.playlist import PlaylistPickerMenu
-            from pylavcogs_shared.ui.sources.playlist import PlaylistPickerSource
+            from pylavcogs_shared.ui.sources.playlist import ScopedPlaylistPickerSource
 
             await PlaylistPickerMenu(
                 cog=self.cog,
                 bot=self.cog.bot,
                 selector_cls=PlaylistPlaySelector,
-                source=PlaylistPickerSource(
+                source=ScopedPlaylistPickerSource(
                     guild_id=context.guild.id,
                     cog=self.cog,
-                    pages=playlists,
+                    scopes=scopes,
                     message_str=_("Playlists you can currently play"),
                 ),
                 delete_after_timeout=True,
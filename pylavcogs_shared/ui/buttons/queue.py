@@ -5,13 +5,14 @@ import typing
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.player import Player
 from pylav.types import CogT, InteractionT
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PreviousTrackButton(discord.ui.Button):
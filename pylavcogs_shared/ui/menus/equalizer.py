@@ -2,6 +2,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from redbot.core.i18n import Translator
+from pylavcogs_shared.i18n import SharedTranslator
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
@@ -2,27 +2,53 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from pathlib import Path
 from typing import Any
 
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.vendored.discord.ext import menus
 
 from pylav.types import BotT, CogT, ContextT, InteractionT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.types import GenericT, SourcesT
 from pylavcogs_shared.ui.buttons.generic import CloseButton, NavigateButton, NoButton, RefreshButton, YesButton
 from pylavcogs_shared.ui.selectors.generic import EntrySelectSelector
 from pylavcogs_shared.ui.sources.generic import EntryPickerSource
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.menu.generic")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+
+_MISSING = object()
+
+
+class _PageView:
+    """Stands in for a menu while another of its pages is rendered, so the source sees that page as the current one"""
+
+    __slots__ = ("_menu", "current_page")
+
+    def __init__(self, menu: BaseMenu, current_page: int) -> None:
+        self._menu = menu
+        self.current_page = current_page
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._menu, name)
 
 
 class BaseMenu(discord.ui.View):
+    """The base for all PyLav menus.
+
+    If ``prefetch`` is True the pages either side of the current one are rendered in the background,
+    so moving to them doesn't have to wait for the render.
+    Only enable it for sources whose ``get_page`` and ``format_page`` don't change the state of the source or menu,
+    prefetched pages are discarded if the source's ``data_version()`` changes, the menu is refreshed or stopped,
+    or, if ``prefetch_ttl`` is set, once they are older than that many seconds.
+    """
+
     def __init__(
         self,
         cog: CogT,
@@ -33,6 +59,8 @@ class BaseMenu(discord.ui.View):
         timeout: int = 120,
         message: discord.Message = None,
         starting_page: int = 0,
+        prefetch: bool = False,
+        prefetch_ttl: float | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -47,13 +75,23 @@ class BaseMenu(discord.ui.View):
         self.delete_after_timeout = delete_after_timeout
         self.current_page = starting_page or kwargs.get("page_start", 0)
         self._running = True
+        self.prefetch = prefetch
+        self.prefetch_ttl = prefetch_ttl
+        # Keyed by page number, the values are (data version, scheduled at, render task)
+        self._prefetched: dict[int, tuple[Any, float, asyncio.Task]] = {}
 
     @property
     def source(self) -> menus.ListPageSource:
         return self._source
 
+    def stop(self) -> None:
+        self._running = False
+        self.clear_prefetched()
+        super().stop()
+
     async def on_timeout(self):
         self._running = False
+        self.clear_prefetched()
         if self.message is None:
             return
         with contextlib.suppress(discord.HTTPException):
@@ -62,16 +100,62 @@ class BaseMenu(discord.ui.View):
             else:
                 await self.message.edit(view=None)
 
+    def _data_version(self) -> Any:
+        return self.source.data_version() if hasattr(self.source, "data_version") else None
+
+    def clear_prefetched(self) -> None:
+        """Discard the pages rendered in the background"""
+        for __, __, task in self._prefetched.values():
+            task.cancel()
+        self._prefetched.clear()
+
+    async def _render_page(self, page_num: int) -> Any:
+        page = await self.source.get_page(page_num)
+        return await self.source.format_page(_PageView(self, page_num), page)
+
+    def _is_fresh(self, version: Any, scheduled_at: float) -> bool:
+        if self.prefetch_ttl is not None and time.monotonic() - scheduled_at > self.prefetch_ttl:
+            return False
+        return version == self._data_version()
+
+    async def _take_prefetched(self, page_num: int) -> Any:
+        if (entry := self._prefetched.pop(page_num, None)) is None:
+            return _MISSING
+        version, scheduled_at, task = entry
+        if not self._is_fresh(version, scheduled_at):
+            task.cancel()
+            return _MISSING
+        try:
+            return await task
+        except Exception:
+            return _MISSING
+
+    def _schedule_prefetch(self, page_num: int) -> None:
+        max_pages = self.source.get_max_pages()
+        wanted = {(page_num + offset) % max_pages for offset in (-1, 1)} - {page_num} if max_pages else set()
+        for stale in [n for n, (v, at, __) in self._prefetched.items() if n not in wanted or not self._is_fresh(v, at)]:
+            self._prefetched.pop(stale)[2].cancel()
+        version = self._data_version()
+        for n in wanted - self._prefetched.keys():
+            self._prefetched[n] = (version, time.monotonic(), asyncio.create_task(self._render_page(n)))
+
     async def get_page(self, page_num: int):
+        value = _MISSING
         try:
             if page_num >= self._source.get_max_pages():
                 page_num = 0
                 self.current_page = 0
-            page = await self.source.get_page(page_num)
+            if self.prefetch:
+                value = await self._take_prefetched(page_num)
+            if value is _MISSING:
+                page = await self.source.get_page(page_num)
         except IndexError:
-            self.current_page = 0
+            self.current_page = page_num = 0
             page = await self.source.get_page(self.current_page)
-        value = await self.source.format_page(self, page)
+        if value is _MISSING:
+            value = await self.source.format_page(self, page)
+        if self.prefetch and self._running:
+            self._schedule_prefetch(page_num)
         if isinstance(value, dict):
             return value
         elif isinstance(value, str):
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Any
 
 import discord
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import inline
 
 from pylav import emojis
@@ -17,21 +16,23 @@ from pylav.sql.models import NodeModel
 from pylav.types import BotT, CogT, ContextT, InteractionT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.buttons.generic import CloseButton, DoneButton, NavigateButton, RefreshButton
 from pylavcogs_shared.ui.buttons.nodes import (
     NodeButton,
     NodeDeleteButton,
     NodeShowEnabledSourcesButton,
+    ProbeNodesButton,
     SearchOnlyNodeToggleButton,
     SSLNodeToggleButton,
 )
 from pylavcogs_shared.ui.menus.generic import BaseMenu
 from pylavcogs_shared.ui.modals.generic import PromptForInput
-from pylavcogs_shared.ui.selectors.nodes import NodeSelectSelector, SourceSelector
-from pylavcogs_shared.ui.sources.nodes import NodeManageSource, NodePickerSource
+from pylavcogs_shared.ui.selectors.nodes import NodeSelectSelector, ProbeSortSelector, SourceSelector
+from pylavcogs_shared.ui.sources.nodes import NodeManageSource, NodePickerSource, NodeProbeSource
 
 URL_REGEX = re.compile(r"^(https?)://(\S+)$")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class AddNodeFlow(discord.ui.View):
@@ -553,6 +554,7 @@ class NodeManagerMenu(BaseMenu):
         )
         self.delete_button = NodeDeleteButton(cog=self.cog, style=discord.ButtonStyle.red, row=2)
         self.disabled_sources_selector = SourceSelector(cog=self.cog, placeholder=_("Source to disable"), row=3)
+        self.probe_button = ProbeNodesButton(cog=self.cog, style=discord.ButtonStyle.grey, row=4)
 
         self.cancelled = True
 
@@ -597,6 +599,7 @@ class NodeManagerMenu(BaseMenu):
         if max_pages <= 2:
             self.first_button.disabled = True
             self.last_button.disabled = True
+        self.add_item(self.probe_button)
         if self.source.target:
             self.add_item(self.show_sources_button)
             if self.source.target.identifier not in BUNDLED_NODES_IDS:
@@ -746,3 +749,48 @@ class NodeManagerMenu(BaseMenu):
                 ),
                 ephemeral=True,
             )
+
+
+class NodeProbeMenu(BaseMenu):
+    _source: NodeProbeSource
+
+    def __init__(
+        self,
+        cog: CogT,
+        bot: BotT,
+        source: NodeProbeSource,
+        original_author: discord.abc.User,
+        *,
+        delete_after_timeout: bool = True,
+        timeout: int = 120,
+        message: discord.Message = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            cog,
+            bot,
+            source,
+            delete_after_timeout=delete_after_timeout,
+            timeout=timeout,
+            message=message,
+            **kwargs,
+        )
+        self.author = original_author
+        self.close_button = CloseButton(style=discord.ButtonStyle.red, cog=cog, row=0)
+        self.probe_button = ProbeNodesButton(cog=cog, style=discord.ButtonStyle.grey, row=0)
+        self.sort_selector = ProbeSortSelector(cog=cog, row=1)
+        self.add_item(self.close_button)
+        self.add_item(self.probe_button)
+        self.add_item(self.sort_selector)
+
+    @property
+    def source(self) -> NodeProbeSource:
+        return self._source
+
+    async def start(self, ctx: PyLavContext | InteractionT):
+        if isinstance(ctx, discord.Interaction):
+            ctx = await self.cog.bot.get_context(ctx)
+        if ctx.interaction and not ctx.interaction.response.is_done():
+            await ctx.defer(ephemeral=True)
+        self.ctx = ctx
+        await self.send_initial_message(ctx)
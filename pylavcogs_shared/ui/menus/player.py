@@ -5,17 +5,17 @@ from typing import Any
 
 import asyncstdlib
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.types import BotT, CogT, InteractionT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.buttons.generic import CloseButton, LabelButton, NavigateButton, RefreshButton
 from pylavcogs_shared.ui.buttons.player import DisconnectAllButton, DisconnectButton, StopTrackButton
 from pylavcogs_shared.ui.menus.generic import BaseMenu
 from pylavcogs_shared.ui.sources.player import PlayersSource
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class StatsMenu(BaseMenu):
@@ -6,13 +6,13 @@ from pathlib import Path
 from typing import Any
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav import emojis
 from pylav.sql.models import PlaylistModel
 from pylav.types import BotT, CogT, ContextT, InteractionT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.buttons.generic import CloseButton, DoneButton, NavigateButton, RefreshButton
 from pylavcogs_shared.ui.buttons.playlist import (
     EnqueuePlaylistButton,
@@ -30,7 +30,7 @@ from pylavcogs_shared.ui.modals.generic import PromptForInput
 from pylavcogs_shared.ui.selectors.playlist import PlaylistPlaySelector, PlaylistSelectSelector
 from pylavcogs_shared.ui.sources.playlist import PlaylistPickerSource
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlaylistPickerMenu(BaseMenu):
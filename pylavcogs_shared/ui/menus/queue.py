@@ -5,12 +5,12 @@ from pathlib import Path
 from typing import Any, Literal
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.player import Player
 from pylav.types import BotT, CogT, InteractionT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.buttons.generic import CloseButton, NavigateButton, RefreshButton
 from pylavcogs_shared.ui.buttons.queue import (
     DecreaseVolumeButton,
@@ -33,9 +33,10 @@ from pylavcogs_shared.ui.buttons.queue import (
 from pylavcogs_shared.ui.menus.generic import BaseMenu
 from pylavcogs_shared.ui.selectors.queue import QueueSelectTrack
 from pylavcogs_shared.ui.sources.queue import QueuePickerSource, QueueSource
+from pylavcogs_shared.utils.caching import QUEUE_PAGE_CACHE
 from pylavcogs_shared.utils.decorators import is_dj_logic
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class QueueMenu(BaseMenu):
@@ -53,6 +54,7 @@ class QueueMenu(BaseMenu):
         message: discord.Message = None,
         starting_page: int = 0,
         history: bool = False,
+        prefetch: bool = True,
         **kwargs: Any,
     ) -> None:
         super().__init__(
@@ -63,6 +65,9 @@ class QueueMenu(BaseMenu):
             timeout=timeout,
             message=message,
             starting_page=starting_page,
+            # The pages show the position of the current track, so they go stale as fast as the queue page cache
+            prefetch=prefetch,
+            prefetch_ttl=QUEUE_PAGE_CACHE.ttl,
             **kwargs,
         )
         self.author = original_author
@@ -3,11 +3,12 @@ from __future__ import annotations
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.types import CogT, InteractionT
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlaylistSaveModal(discord.ui.Modal):
@@ -4,12 +4,13 @@ from pathlib import Path
 
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
+
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.modals.queue")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class EnqueueModal(discord.ui.Modal):
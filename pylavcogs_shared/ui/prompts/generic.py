@@ -3,17 +3,16 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from redbot.core.i18n import Translator
-
 from pylav.types import CogT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.types import GenericT
 from pylavcogs_shared.ui.menus.generic import EntryPickerMenu
 from pylavcogs_shared.ui.selectors.generic import EntrySelectSelector
 from pylavcogs_shared.ui.sources.generic import EntryPickerSource
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 async def maybe_prompt_for_entry(
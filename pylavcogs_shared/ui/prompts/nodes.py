@@ -3,17 +3,17 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from redbot.core.i18n import Translator
-
 from pylav.sql.models import NodeModel
 from pylav.types import CogT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.menus.nodes import NodePickerMenu
 from pylavcogs_shared.ui.selectors.nodes import NodeSelectSelector
 from pylavcogs_shared.ui.sources.nodes import NodePickerSource
+from pylavcogs_shared.utils.nodes import fetch_node_metadata
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 async def maybe_prompt_for_node(cog: CogT, context: PyLavContext, nodes: list[NodeModel]) -> NodeModel | None:
@@ -26,6 +26,7 @@ async def maybe_prompt_for_node(cog: CogT, context: PyLavContext, nodes: list[No
                 cog=cog,
                 pages=nodes,
                 message_str=_("Multiple nodes matched, pick the one which you meant"),
+                metadata=await fetch_node_metadata(nodes),
             ),
             selector_cls=NodeSelectSelector,
             delete_after_timeout=True,
@@ -3,17 +3,16 @@ from __future__ import annotations
 import asyncio
 from pathlib import Path
 
-from redbot.core.i18n import Translator
-
 from pylav.sql.models import PlaylistModel
 from pylav.types import CogT
 from pylav.utils import PyLavContext
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.menus.playlist import PlaylistPickerMenu
 from pylavcogs_shared.ui.selectors.playlist import PlaylistSelectSelector
 from pylavcogs_shared.ui.sources.playlist import PlaylistPickerSource
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 async def maybe_prompt_for_playlist(
@@ -5,19 +5,19 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import discord
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_list
 
 from pylav.constants import SUPPORTED_SOURCES
 from pylav.sql.models import NodeModel
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.nodes import SOURCE_OPTIONS, NodeOption
 
 if TYPE_CHECKING:
-    from pylavcogs_shared.ui.menus.nodes import AddNodeFlow
+    from pylavcogs_shared.ui.menus.nodes import AddNodeFlow, NodeProbeMenu
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class SourceSelector(discord.ui.Select):
@@ -83,3 +83,26 @@ class NodeSelectSelector(discord.ui.Select):
         self.responded.set()
         self.view.stop()
         await self.view.on_timeout()
+
+
+class ProbeSortSelector(discord.ui.Select):
+    view: NodeProbeMenu
+
+    def __init__(self, cog: CogT, row: int | None = None):
+        super().__init__(
+            min_values=1,
+            max_values=1,
+            options=[
+                discord.SelectOption(label=_("REST latency"), value="latency"),
+                discord.SelectOption(label=_("Penalty"), value="penalty"),
+                discord.SelectOption(label=_("Frames lost"), value="frames_lost"),
+                discord.SelectOption(label=_("Name"), value="name"),
+            ],
+            placeholder=_("Sort nodes by"),
+            row=row,
+        )
+        self.cog = cog
+
+    async def callback(self, interaction: InteractionT):
+        self.view.source.sort_by = self.values[0]
+        await self.view.show_page(0, interaction)
@@ -3,12 +3,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.constants import SUPPORTED_SOURCES
 from pylav.sql.models import NodeModel
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.nodes import NodeMetadata, fetch_node_metadata
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class SourceOption(discord.SelectOption):
@@ -25,10 +27,11 @@ SOURCE_OPTIONS = [SourceOption(name=source, description=None, value=source) for
 
 class NodeOption(discord.SelectOption):
     @classmethod
-    async def from_node(cls, node: NodeModel, index: int):
-        data = await node.fetch_all()
+    async def from_node(cls, node: NodeModel, index: int, metadata: NodeMetadata | None = None):
+        if metadata is None:
+            metadata = (await fetch_node_metadata([node]))[node.id]
         return cls(
-            label=f"{index + 1}. {data['name']}",
-            description=_("ID: {} || SSL: {} || Search-only: {}").format(node.id, data["ssl"], data["search_only"]),
+            label=f"{index + 1}. {metadata.name}",
+            description=_("ID: {} || SSL: {} || Search-only: {}").format(node.id, metadata.ssl, metadata.search_only),
             value=f"{node.id}",
         )
@@ -3,23 +3,29 @@ from __future__ import annotations
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.sql.models import PlaylistModel
 from pylav.types import BotT
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.playlists import PlaylistMetadata, fetch_playlist_metadata
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlaylistOption(discord.SelectOption):
     @classmethod
-    async def from_playlist(cls, playlist: PlaylistModel, bot: BotT, index: int):
+    async def from_playlist(
+        cls, playlist: PlaylistModel, bot: BotT, index: int, metadata: PlaylistMetadata | None = None
+    ):
+        if metadata is None:
+            metadata = (await fetch_playlist_metadata([playlist]))[playlist.id]
         return cls(
-            label=f"{index + 1}. {await playlist.fetch_name()}",
+            label=f"{index + 1}. {metadata.name}",
             description=_("Tracks: {} || {} || {}").format(
-                await playlist.size(),
-                await playlist.get_author_name(bot, mention=False),
-                await playlist.get_scope_name(bot, mention=False),
+                metadata.size,
+                metadata.get_author_name(bot, mention=False),
+                metadata.get_scope_name(bot, mention=False),
             ),
             value=f"{playlist.id}",
         )
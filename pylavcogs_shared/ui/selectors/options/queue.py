@@ -3,11 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.tracks import Track
 
-_ = Translator("PyLavShared", Path(__file__))
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.caching import fetch_track_display_name
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class QueueTrackOption(discord.SelectOption):
@@ -20,8 +22,8 @@ class QueueTrackOption(discord.SelectOption):
 
     @classmethod
     async def from_track(cls, track: Track, index: int):
-        name = await track.get_track_display_name(
-            max_length=100 - (2 + len(str(index + 1))), author=False, unformatted=True
+        name = await fetch_track_display_name(
+            track.track, track, max_length=100 - (2 + len(str(index + 1))), author=False, unformatted=True
         )
         label = f"{index + 1}. {name}"
         return cls(
@@ -50,7 +52,7 @@ class SearchTrackOption(discord.SelectOption):
 
     @classmethod
     async def from_track(cls, track: Track, index: int):
-        name = await track.get_track_display_name(
-            max_length=100 - (2 + len(str(index + 1))), author=False, unformatted=True
+        name = await fetch_track_display_name(
+            track.track, track, max_length=100 - (2 + len(str(index + 1))), author=False, unformatted=True
         )
         return cls(name=f"{index + 1}. {name}", description=track.author, value=track.id)
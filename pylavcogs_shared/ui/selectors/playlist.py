@@ -4,14 +4,14 @@ import asyncio
 from pathlib import Path
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.sql.models import PlaylistModel
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.playlist import PlaylistOption
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlaylistSelectSelector(discord.ui.Select):
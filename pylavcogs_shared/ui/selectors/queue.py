@@ -4,14 +4,14 @@ from pathlib import Path
 from typing import Literal
 
 import discord
-from redbot.core.i18n import Translator
 
 from pylav.tracks import Track
 from pylav.types import CogT, InteractionT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.queue import QueueTrackOption, SearchTrackOption
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class QueueSelectTrack(discord.ui.Select):
@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
 from redbot.vendored.discord.ext import menus
 from tabulate import tabulate
@@ -13,11 +12,22 @@ from tabulate import tabulate
 from pylav.types import CogT
 from pylav.utils.theme import EightBitANSI
 
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.caching import locale_cached
+
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.generic import BaseMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.equalizer")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+
+@locale_cached
+def _preset_headers() -> tuple[str, str]:
+    return (
+        EightBitANSI.paint_yellow(_("Preset Name"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Author"), bold=True, underline=True),
+    )
 
 
 class EQPresetsSource(menus.ListPageSource):
@@ -32,8 +42,7 @@ class EQPresetsSource(menus.ListPageSource):
         return start, page_num
 
     async def format_page(self, menu: BaseMenu, page: list[tuple[str, dict]]) -> discord.Embed:
-        header_name = EightBitANSI.paint_yellow(_("Preset Name"), bold=True, underline=True)
-        header_author = EightBitANSI.paint_yellow(_("Author"), bold=True, underline=True)
+        header_name, header_author = _preset_headers()
         data = []
         for preset_name, preset_data in page:
             try:
@@ -4,26 +4,26 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import asyncstdlib
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, humanize_number
 from redbot.vendored.discord.ext import menus
 
 from pylav.types import CogT
 from pylav.utils.theme import EightBitANSI
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.types import GenericT
 from pylavcogs_shared.ui.selectors.options.generic import EntryOption
 from pylavcogs_shared.utils import Mutator
+from pylavcogs_shared.utils.concurrency import build_options
 
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.generic import BaseMenu, EntryPickerMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.generic")
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PreformattedSource(menus.ListPageSource):
@@ -98,15 +98,15 @@ class EntryPickerSource(menus.ListPageSource):
         if page_number > self.get_max_pages():
             page_number = 0
         base = page_number * self.per_page
-        self.select_options.clear()
+        entries = self.entries[base : base + self.per_page]  # noqa: E203
+        mutated = [Mutator(entry) for entry in entries]
+        options = await build_options(
+            mutated, lambda entry, i: EntryOption.from_entry(entry=entry, index=i), start=base
+        )
+        self.select_options[:] = options
         self.select_mapping.clear()
-        async for i, entry in asyncstdlib.enumerate(
-            asyncstdlib.iter(self.entries[base : base + self.per_page]), start=base
-        ):  # n
-            new_entry = Mutator(entry)
-            self.select_options.append(await EntryOption.from_entry(entry=new_entry, index=i))
-            self.select_mapping[f"{new_entry.id}"] = entry
-        return self.entries[base : base + self.per_page]  # noqa: E203
+        self.select_mapping.update((f"{new_entry.id}", entry) for new_entry, entry in zip(mutated, entries))
+        return entries
 
     def get_max_pages(self):
         """:class:`int`: The maximum number of pages required to paginate this sequence"""
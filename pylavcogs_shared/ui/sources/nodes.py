@@ -4,12 +4,10 @@ import contextlib
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import asyncstdlib
 import discord
 import humanize
 from red_commons.logging import getLogger
 from redbot.core import i18n
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box, humanize_number
 from redbot.vendored.discord.ext import menus
 from tabulate import tabulate
@@ -19,17 +17,83 @@ from pylav.sql.models import NodeModel
 from pylav.types import CogT
 from pylav.utils.theme import EightBitANSI
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.nodes import NodeOption
+from pylavcogs_shared.utils.caching import NODE_PAGE_CACHE, get_node_plugins, locale_cached
+from pylavcogs_shared.utils.concurrency import build_options
+from pylavcogs_shared.utils.node_stats import METRICS, NODE_STATS, NodeProbe, probe_nodes, sort_probes
+from pylavcogs_shared.utils.nodes import NodeMetadata, fetch_node_metadata
 
 if TYPE_CHECKING:
-    from pylavcogs_shared.ui.menus.nodes import NodeManagerMenu, NodePickerMenu
+    from pylavcogs_shared.ui.menus.nodes import NodeManagerMenu, NodePickerMenu, NodeProbeMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.node")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+
+@locale_cached
+def _node_page_labels() -> dict[str, str]:
+    return {
+        "yes": EightBitANSI.paint_green(_("Yes")),
+        "no": EightBitANSI.paint_red(_("No")),
+        "unknown": EightBitANSI.paint_red(_("Unknown")),
+        "no_plugins": EightBitANSI.paint_red(_("None / Unknown")),
+        "plugin_spaced": EightBitANSI.paint_white(_("Name: {name}\nVersion: {version}\n\n")),
+        "coordinates": EightBitANSI.paint_white(_("Latitude: {lat}\nLongitude: {lon}")),
+        "property_header": EightBitANSI.paint_yellow(_("Property"), bold=True, underline=True),
+        "value_header": EightBitANSI.paint_yellow(_("Value"), bold=True, underline=True),
+        "region": EightBitANSI.paint_white(_("Region")),
+        "coordinates_label": EightBitANSI.paint_white(_("Coordinates")),
+        "host": EightBitANSI.paint_white(_("Host")),
+        "port": EightBitANSI.paint_white(_("Port")),
+        "password": EightBitANSI.paint_white(_("Password")),
+        "ssl": EightBitANSI.paint_white(_("SSL")),
+        "available": EightBitANSI.paint_white(_("Available")),
+        "search_only": EightBitANSI.paint_white(_("Search Only")),
+        "players": EightBitANSI.paint_white(_("Players\nConnected\nActive")),
+        "frames_lost": EightBitANSI.paint_white(_("Frames Lost")),
+        "uptime": EightBitANSI.paint_white(_("Uptime")),
+        "cpu_load": EightBitANSI.paint_white(_("CPU Load\nLavalink\nSystem")),
+        "penalty": EightBitANSI.paint_white(_("Penalty")),
+        "memory": EightBitANSI.paint_white(_("Memory\nUsed\nFree\nAllocated\nReservable")),
+        "plugins": EightBitANSI.paint_white(_("Plugins")),
+        "history": EightBitANSI.paint_white(_("History\nLavalink CPU\nFrames Lost\nMemory Used\nPenalty")),
+        "node_header": EightBitANSI.paint_yellow(_("Node"), bold=True, underline=True),
+        "connected_header": EightBitANSI.paint_yellow(_("Connected"), bold=True, underline=True),
+        "latency_header": EightBitANSI.paint_yellow(_("REST Latency"), bold=True, underline=True),
+        "penalty_header": EightBitANSI.paint_yellow(_("Penalty"), bold=True, underline=True),
+        "frames_lost_header": EightBitANSI.paint_yellow(_("Frames Lost"), bold=True, underline=True),
+    }
+
+
+def _format_trends(node: Node) -> str:
+    """A sparkline with the min, max and p95 of each recorded stat of the node, one line per stat"""
+    if not (history := NODE_STATS.get(node)):
+        return "-" + "\n?" * len(METRICS)
+    lines = ["-"]
+    for metric in METRICS:
+        if (summary := history.summary(metric)) is None:
+            lines.append("?")
+            continue
+        if metric == "memory_used":
+            low, high, p95 = (humanize.naturalsize(value, binary=True) for value in summary)
+        elif metric == "penalty":
+            low, high, p95 = (humanize_number(round(value, 2)) for value in summary)
+        else:
+            low, high, p95 = (f"{humanize_number(round(value, 2))}%" for value in summary)
+        lines.append(f"{history.sparkline(metric)} {low}-{high} p95 {p95}")
+    return EightBitANSI.paint_blue("\n".join(lines))
 
 
 class NodePickerSource(menus.ListPageSource):
-    def __init__(self, guild_id: int, cog: CogT, pages: list[NodeModel], message_str: str):
+    def __init__(
+        self,
+        guild_id: int,
+        cog: CogT,
+        pages: list[NodeModel],
+        message_str: str,
+        metadata: dict[int, NodeMetadata] | None = None,
+    ):
         super().__init__(entries=pages, per_page=5)
         self.message_str = message_str
         self.per_page = 5
@@ -37,6 +101,7 @@ class NodePickerSource(menus.ListPageSource):
         self.select_options: list[NodeOption] = []
         self.cog = cog
         self.select_mapping: dict[str, NodeModel] = {}
+        self.metadata: dict[int, NodeMetadata] = metadata or {}
 
     def get_starting_index_and_page_number(self, menu: NodePickerMenu) -> tuple[int, int]:
         page_num = menu.current_page
@@ -60,18 +125,152 @@ class NodePickerSource(menus.ListPageSource):
         if page_number > self.get_max_pages():
             page_number = 0
         base = page_number * self.per_page
-        self.select_options.clear()
+        nodes = self.entries[base : base + self.per_page]  # noqa: E203
+        if missing := [node for node in nodes if node.id not in self.metadata]:
+            self.metadata.update(await fetch_node_metadata(missing))
+        options = await build_options(
+            nodes, lambda node, i: NodeOption.from_node(node=node, index=i, metadata=self.metadata[node.id]), start=base
+        )
+        self.select_options[:] = options
         self.select_mapping.clear()
-        for i, node in enumerate(self.entries[base : base + self.per_page], start=base):  # noqa: E203
-            self.select_options.append(await NodeOption.from_node(node=node, index=i))
-            self.select_mapping[f"{node.id}"] = node
-        return self.entries[base : base + self.per_page]  # noqa: E203
+        self.select_mapping.update((f"{node.id}", node) for node in nodes)
+        return nodes
 
     def get_max_pages(self):
         """:class:`int`: The maximum number of pages required to paginate this sequence"""
         return self._max_pages or 1
 
 
+def _node_page_fields(node: Node, locale: str) -> tuple:
+    """The values shown on a node's page, formatted the way they are displayed, in table order"""
+    with contextlib.suppress(Exception):
+        humanize.i18n.activate(locale)
+    try:
+        if stats := node.stats:
+            frames_lost = (abs(stats.frames_deficit) + abs(stats.frames_nulled)) / (stats.frames_sent or 1)
+            frames_lost = f"{frames_lost * 100:.2f}%" if frames_lost > 0 else "0%"
+            uptime = humanize.naturaldelta(stats.uptime_seconds)
+            lavalink_load = humanize_number(round(stats.lavalink_load, 2))
+            system_load = humanize_number(round(stats.system_load, 2))
+            memory = tuple(
+                humanize.naturalsize(value, binary=True)
+                for value in (
+                    stats.memory_used,
+                    stats.memory_free,
+                    stats.memory_allocated,
+                    stats.memory_reservable,
+                )
+            )
+            penalty = humanize_number(round(node.penalty - 1, 2))
+        else:
+            frames_lost = "0%"
+            uptime = lavalink_load = system_load = penalty = "?"
+            memory = ("?",) * 4
+    finally:
+        humanize.i18n.deactivate()
+    history = NODE_STATS.get(node)
+    return (
+        node.region,
+        node.coordinates,
+        node.host,
+        node.port,
+        min(len(node.password), 10),
+        node.ssl,
+        node.available,
+        node.search_only,
+        len(node.connected_players),
+        node.server_connected_players,
+        len(node.playing_players),
+        node.server_playing_players,
+        frames_lost,
+        uptime,
+        lavalink_load,
+        system_load,
+        penalty,
+        memory,
+        (id(history), history.revision) if history else None,
+        tuple((plugin.get("name"), plugin.get("version")) for plugin in get_node_plugins(node) or []),
+    )
+
+
+def render_node_page(node: Node) -> str:
+    """The table describing a node shown by the node list and node manager menus.
+
+    The table is only rebuilt when one of the values it shows, or the locale, has changed since it was last rendered.
+    """
+    locale = f"{i18n.get_babel_locale()}"
+    fields = (locale, *_node_page_fields(node, locale))
+    if (cached := NODE_PAGE_CACHE.get(node.identifier)) is not None and cached[0] == fields:
+        return cached[1]
+    (
+        __,
+        region,
+        coord,
+        host,
+        port,
+        password_length,
+        ssl,
+        available,
+        search_only,
+        pylav_connected_players,
+        server_connected_players,
+        pylav_active_players,
+        server_active_players,
+        frames_lost,
+        uptime,
+        lavalink_load,
+        system_load,
+        penalty,
+        (used, free, allocated, reservable),
+        __,
+        plugins,
+    ) = fields
+    labels = _node_page_labels()
+    no = labels["no"]
+    yes = labels["yes"]
+    plugins_str = "".join(
+        labels["plugin_spaced"].format(
+            name=EightBitANSI.paint_blue(name) or labels["unknown"],
+            version=EightBitANSI.paint_blue(version) or labels["unknown"],
+        )
+        for name, version in plugins
+    )
+    plugins_str = plugins_str.strip() or labels["no_plugins"]
+    coordinate_str = labels["coordinates"].format(
+        lat=EightBitANSI.paint_blue(coord[0] if coord else "?"),
+        lon=EightBitANSI.paint_blue(coord[1] if coord else "?"),
+    )
+    data = {
+        labels["region"]: EightBitANSI.paint_blue(region or _("N/A")),
+        labels["coordinates_label"]: coordinate_str,
+        labels["host"]: EightBitANSI.paint_blue(host),
+        labels["port"]: EightBitANSI.paint_blue(port),
+        labels["password"]: EightBitANSI.paint_blue("*" * password_length),
+        labels["ssl"]: yes if ssl else no,
+        labels["available"]: yes if available else no,
+        labels["search_only"]: yes if search_only else no,
+        labels["players"]: EightBitANSI.paint_blue(
+            f"-\n{pylav_connected_players}/{server_connected_players or '?'}\n"
+            f"{pylav_active_players}/{server_active_players or '?'}"
+        ),
+        labels["frames_lost"]: EightBitANSI.paint_blue(frames_lost),
+        labels["uptime"]: EightBitANSI.paint_blue(uptime),
+        labels["cpu_load"]: EightBitANSI.paint_blue(f"-\n{lavalink_load}%\n{system_load}%"),
+        labels["penalty"]: EightBitANSI.paint_blue(penalty),
+        labels["memory"]: EightBitANSI.paint_blue(f"-\n{used}\n{free}\n{allocated}\n{reservable}"),
+        labels["history"]: _format_trends(node),
+        labels["plugins"]: plugins_str,
+    }
+    t_property = labels["property_header"]
+    t_values = labels["value_header"]
+    description = box(
+        tabulate([{t_property: k, t_values: v} for k, v in data.items()], headers="keys", tablefmt="fancy_grid"),
+        lang="ansi",
+    )
+    NODE_PAGE_CACHE.put(node.identifier, (fields, description))
+    return description
+
+
 class NodeListSource(menus.ListPageSource):
     def __init__(self, cog: CogT, pages: list[Node]):
         super().__init__(entries=pages, per_page=1)
@@ -85,109 +284,10 @@ class NodeListSource(menus.ListPageSource):
     async def format_page(self, menu: NodeManagerMenu, node: Node) -> discord.Embed | str:
 
         idx_start, page_num = self.get_starting_index_and_page_number(menu)
-        region = node.region
-        coord = node.coordinates
-        host = node.host
-        port = node.port
-        password = node.password
-        no = EightBitANSI.paint_red(_("No"))
-        yes = EightBitANSI.paint_green(_("Yes"))
-
-        secure = yes if node.ssl else no
-        connected = yes if node.available else no
-        search_only = yes if node.search_only else no
-        locale = f"{i18n.get_babel_locale()}"
-        with contextlib.suppress(Exception):
-            humanize.i18n.activate(locale)
-
-        server_connected_players = node.server_connected_players
-        server_active_players = node.server_playing_players
-        pylav_connected_players = len(node.connected_players)
-        pylav_active_players = len(node.playing_players)
-        if node.stats:
-            frames_sent = node.stats.frames_sent
-            frames_nulled = node.stats.frames_nulled
-            frames_deficit = node.stats.frames_deficit
-
-            uptime = humanize.naturaldelta(node.stats.uptime_seconds)
-            system_load = humanize_number(round(node.stats.system_load, 2))
-            lavalink_load = humanize_number(round(node.stats.lavalink_load, 2))
-
-            free = humanize.naturalsize(node.stats.memory_free, binary=True)
-            used = humanize.naturalsize(node.stats.memory_used, binary=True)
-            allocated = humanize.naturalsize(node.stats.memory_allocated, binary=True)
-            reservable = humanize.naturalsize(node.stats.memory_reservable, binary=True)
-            penalty = humanize_number(round(node.penalty - 1, 2))
-        else:
-            frames_sent = 0
-            frames_nulled = 0
-            frames_deficit = 0
-            uptime = "?"
-            system_load = "?"
-            lavalink_load = "?"
-            free = "?"
-            used = "?"
-            allocated = "?"
-            reservable = "?"
-            penalty = "?"
-        try:
-            plugins = await node.get_plugins()
-        except Exception:
-            plugins = {}
-        plugins_str = ""
-        for plugin in plugins:
-            plugins_str += EightBitANSI.paint_white(_("Name: {name}\nVersion: {version}")).format(
-                name=EightBitANSI.paint_blue(plugin.get("name")) or EightBitANSI.paint_red(_("Unknown")),
-                version=EightBitANSI.paint_blue(plugin.get("version")) or EightBitANSI.paint_red(_("Unknown")),
-            )
-            plugins_str += "\n\n"
-        plugins_str = plugins_str.strip() or EightBitANSI.paint_red(_("None / Unknown"))
-        humanize.i18n.deactivate()
-        t_property = EightBitANSI.paint_yellow(_("Property"), bold=True, underline=True)
-        t_values = EightBitANSI.paint_yellow(_("Value"), bold=True, underline=True)
-        coordinate_str = EightBitANSI.paint_white(_("Latitude: {lat}\nLongitude: {lon}")).format(
-            lat=EightBitANSI.paint_blue(coord[0] if coord else "?"),
-            lon=EightBitANSI.paint_blue(coord[1] if coord else "?"),
-        )
-
-        data = {
-            EightBitANSI.paint_white(_("Region")): EightBitANSI.paint_blue(region or _("N/A")),
-            EightBitANSI.paint_white(_("Coordinates")): coordinate_str,
-            EightBitANSI.paint_white(_("Host")): EightBitANSI.paint_blue(host),
-            EightBitANSI.paint_white(_("Port")): EightBitANSI.paint_blue(port),
-            EightBitANSI.paint_white(_("Password")): EightBitANSI.paint_blue(
-                "*" * await asyncstdlib.min([len(password), 10])
-            ),
-            EightBitANSI.paint_white(_("SSL")): secure,
-            EightBitANSI.paint_white(_("Available")): connected,
-            EightBitANSI.paint_white(_("Search Only")): search_only,
-            EightBitANSI.paint_white(_("Players\nConnected\nActive")): EightBitANSI.paint_blue(
-                f"-\n{pylav_connected_players}/{server_connected_players or '?'}\n"
-                f"{pylav_active_players}/{server_active_players or '?'}"
-            ),
-            EightBitANSI.paint_white(_("Frames Lost")): EightBitANSI.paint_blue(
-                f"{(abs(frames_deficit) + abs(frames_nulled))/(frames_sent or 1) * 100:.2f}%"
-            )
-            if ((abs(frames_deficit) + abs(frames_nulled)) / (frames_sent or 1)) > 0
-            else EightBitANSI.paint_blue("0%"),
-            EightBitANSI.paint_white(_("Uptime")): EightBitANSI.paint_blue(uptime),
-            EightBitANSI.paint_white(_("CPU Load\nLavalink\nSystem")): EightBitANSI.paint_blue(
-                f"-\n{lavalink_load}%\n{system_load}%"
-            ),
-            EightBitANSI.paint_white(_("Penalty")): EightBitANSI.paint_blue(penalty),
-            EightBitANSI.paint_white(_("Memory\nUsed\nFree\nAllocated\nReservable")): EightBitANSI.paint_blue(
-                f"-\n{used}\n{free}\n{allocated}\n{reservable}"
-            ),
-            EightBitANSI.paint_white(_("Plugins")): plugins_str,
-        }
-        description = box(
-            tabulate([{t_property: k, t_values: v} for k, v in data.items()], headers="keys", tablefmt="fancy_grid"),
-            lang="ansi",
-        )
         embed = await self.cog.lavalink.construct_embed(
             messageable=menu.ctx,
             title=node.name,
-            description=description,
+            description=render_node_page(node),
         )
         embed.set_footer(
             text=_("Page {page_num}/{total_pages} | {num} {plural}").format(
@@ -200,7 +300,7 @@ class NodeListSource(menus.ListPageSource):
         return embed
 
 
-class NodeManageSource(menus.ListPageSource):
+class NodeManageSource(NodeListSource):
     target: Node | None
 
     def __init__(self, cog: CogT):
@@ -231,123 +331,70 @@ class NodeManageSource(menus.ListPageSource):
         self.target = self.entries[page_number]
         return self.target
 
-    def get_starting_index_and_page_number(self, menu: NodeManagerMenu) -> tuple[int, int]:
-        page_num = menu.current_page
-        start = page_num * self.per_page
-        return start, page_num
-
     async def format_page(self, menu: NodeManagerMenu, node: Node) -> discord.Embed | str:
         await menu.prepare()
-        idx_start, page_num = self.get_starting_index_and_page_number(menu)
-        region = node.region
-        coord = node.coordinates
-        host = node.host
-        port = node.port
-        password = node.password
-        no = EightBitANSI.paint_red(_("No"))
-        yes = EightBitANSI.paint_green(_("Yes"))
-
-        secure = yes if node.ssl else no
-        connected = yes if node.available else no
-        search_only = yes if node.search_only else no
-        locale = f"{i18n.get_babel_locale()}"
-        with contextlib.suppress(Exception):
-            humanize.i18n.activate(locale)
-
-        server_connected_players = node.server_connected_players
-        server_active_players = node.server_playing_players
-        pylav_connected_players = len(node.connected_players)
-        pylav_active_players = len(node.playing_players)
-        if node.stats:
-            frames_sent = node.stats.frames_sent
-            frames_nulled = node.stats.frames_nulled
-            frames_deficit = node.stats.frames_deficit
-
-            uptime = humanize.naturaldelta(node.stats.uptime_seconds)
-            system_load = humanize_number(round(node.stats.system_load, 2))
-            lavalink_load = humanize_number(round(node.stats.lavalink_load, 2))
-
-            free = humanize.naturalsize(node.stats.memory_free, binary=True)
-            used = humanize.naturalsize(node.stats.memory_used, binary=True)
-            allocated = humanize.naturalsize(node.stats.memory_allocated, binary=True)
-            reservable = humanize.naturalsize(node.stats.memory_reservable, binary=True)
-            penalty = humanize_number(round(node.penalty - 1, 2))
-        else:
-            frames_sent = 0
-            frames_nulled = 0
-            frames_deficit = 0
-            uptime = "?"
-            system_load = "?"
-            lavalink_load = "?"
-            free = "?"
-            used = "?"
-            allocated = "?"
-            reservable = "?"
-            penalty = "?"
-        try:
-            plugins = await node.get_plugins()
-        except Exception:
-            plugins = {}
-        plugins_str = ""
-        for plugin in plugins:
-            plugins_str += EightBitANSI.paint_white(_("Name: {name}\nVersion: {version}\n\n")).format(
-                name=EightBitANSI.paint_blue(plugin.get("name")) or EightBitANSI.paint_red(_("Unknown")),
-                version=EightBitANSI.paint_blue(plugin.get("version")) or EightBitANSI.paint_red(_("Unknown")),
-            )
-        plugins_str = plugins_str.strip() or EightBitANSI.paint_red(_("None / Unknown"))
-        humanize.i18n.deactivate()
-        t_property = EightBitANSI.paint_yellow(_("Property"), bold=True, underline=True)
-        t_values = EightBitANSI.paint_yellow(_("Value"), bold=True, underline=True)
-        coordinate_str = EightBitANSI.paint_white(_("Latitude: {lat}\nLongitude: {lon}")).format(
-            lat=EightBitANSI.paint_blue(coord[0] if coord else "?"),
-            lon=EightBitANSI.paint_blue(coord[1] if coord else "?"),
-        )
+        return await super().format_page(menu, node)
+
+
+class NodeProbeSource(menus.ListPageSource):
+    """A single page comparing every node, probed concurrently the first time it is shown and after invalidate"""
+
+    def __init__(self, cog: CogT, sort_by: str = "latency"):
+        self.cog = cog
+        self.per_page = 1
+        self.sort_by = sort_by
+        self.probes: list[NodeProbe] | None = None
 
-        data = {
-            EightBitANSI.paint_white(_("Region")): EightBitANSI.paint_blue(region or _("N/A")),
-            EightBitANSI.paint_white(_("Coordinates")): coordinate_str,
-            EightBitANSI.paint_white(_("Host")): EightBitANSI.paint_blue(host),
-            EightBitANSI.paint_white(_("Port")): EightBitANSI.paint_blue(port),
-            EightBitANSI.paint_white(_("Password")): EightBitANSI.paint_blue(
-                "*" * await asyncstdlib.min([len(password), 10])
-            ),
-            EightBitANSI.paint_white(_("SSL")): secure,
-            EightBitANSI.paint_white(_("Available")): connected,
-            EightBitANSI.paint_white(_("Search Only")): search_only,
-            EightBitANSI.paint_white(_("Players\nConnected\nActive")): EightBitANSI.paint_blue(
-                f"-\n{pylav_connected_players}/{server_connected_players or '?'}\n"
-                f"{pylav_active_players}/{server_active_players or '?'}"
-            ),
-            EightBitANSI.paint_white(_("Frames Lost")): EightBitANSI.paint_blue(
-                f"{(abs(frames_deficit) + abs(frames_nulled)) / (frames_sent or 1) * 100:.2f}%"
+    @property
+    def entries(self) -> list[NodeProbe]:
+        return self.probes or []
+
+    def is_paginating(self) -> bool:
+        return False
+
+    def get_max_pages(self) -> int:
+        return 1
+
+    def invalidate(self) -> None:
+        """Probe the nodes again when the page is next shown"""
+        self.probes = None
+
+    async def get_page(self, page_number: int) -> list[NodeProbe]:
+        if self.probes is None:
+            self.probes = await probe_nodes(self.cog.lavalink.node_manager.nodes)
+        return sort_probes(self.probes, self.sort_by)
+
+    async def format_page(self, menu: NodeProbeMenu, probes: list[NodeProbe]) -> discord.Embed:
+        labels = _node_page_labels()
+        rows = []
+        for probe in probes:
+            if probe.latency is not None:
+                latency = EightBitANSI.paint_blue(f"{humanize_number(round(probe.latency))}ms")
+            else:
+                latency = EightBitANSI.paint_red(probe.error or "?")
+            rows.append(
+                {
+                    labels["node_header"]: EightBitANSI.paint_white(probe.name),
+                    labels["connected_header"]: labels["yes"] if probe.connected else labels["no"],
+                    labels["latency_header"]: latency,
+                    labels["penalty_header"]: EightBitANSI.paint_blue(
+                        "?" if probe.penalty is None else humanize_number(round(probe.penalty, 2))
+                    ),
+                    labels["frames_lost_header"]: EightBitANSI.paint_blue(
+                        "?" if probe.frames_lost is None else f"{probe.frames_lost:.2f}%"
+                    ),
+                }
             )
-            if ((abs(frames_deficit) + abs(frames_nulled)) / (frames_sent or 1)) > 0
-            else EightBitANSI.paint_blue("0%"),
-            EightBitANSI.paint_white(_("Uptime")): EightBitANSI.paint_blue(uptime),
-            EightBitANSI.paint_white(_("CPU Load\nLavalink\nSystem")): EightBitANSI.paint_blue(
-                f"-\n{lavalink_load}%\n{system_load}%"
-            ),
-            EightBitANSI.paint_white(_("Penalty")): EightBitANSI.paint_blue(penalty),
-            EightBitANSI.paint_white(_("Memory\nUsed\nFree\nAllocated\nReservable")): EightBitANSI.paint_blue(
-                f"-\n{used}\n{free}\n{allocated}\n{reservable}"
-            ),
-            EightBitANSI.paint_white(_("Plugins")): plugins_str,
-        }
-        description = box(
-            tabulate([{t_property: k, t_values: v} for k, v in data.items()], headers="keys", tablefmt="fancy_grid"),
-            lang="ansi",
-        )
         embed = await self.cog.lavalink.construct_embed(
             messageable=menu.ctx,
-            title=node.name,
-            description=description,
+            title=_("Node health"),
+            description=box(tabulate(rows, headers="keys", tablefmt="fancy_grid"), lang="ansi")
+            if rows
+            else _("There are no nodes to probe"),
         )
         embed.set_footer(
-            text=_("Page {page_num}/{total_pages} | {num} {plural}").format(
-                page_num=humanize_number(page_num + 1),
-                total_pages=humanize_number(self.get_max_pages()),
-                num=len(self.entries),
-                plural=_("nodes") if len(self.entries) != 1 else _("node"),
+            text=_("{num} {plural} probed").format(
+                num=humanize_number(len(probes)), plural=_("nodes") if len(probes) != 1 else _("node")
             )
         )
         return embed
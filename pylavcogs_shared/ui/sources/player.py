@@ -6,20 +6,20 @@ from typing import TYPE_CHECKING
 import asyncstdlib
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 from redbot.vendored.discord.ext import menus
 
 from pylav.player import Player
 from pylav.types import CogT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.utils import rgetattr
 
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.generic import BaseMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.player")
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 
 
 class PlayersSource(menus.ListPageSource):
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
+import functools
 import random
+from collections.abc import Awaitable
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import asyncstdlib
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import humanize_number
 from redbot.vendored.discord.ext import menus
 
 from pylav.query import Query
 from pylav.sql.models import PlaylistModel
+from pylav.sql.tables.playlists import PlaylistRow
 from pylav.tracks import Track
 from pylav.types import CogT
 from pylav.utils import AsyncIter
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.playlist import PlaylistOption
+from pylavcogs_shared.utils.caching import LRUCache, fetch_track_display_name
+from pylavcogs_shared.utils.concurrency import build_options
+from pylavcogs_shared.utils.playlists import fetch_playlist_metadata
+from pylavcogs_shared.utils.tracks import TRACK_DECODE_ERRORS, TrackMetadata, decode_track_metadata
 
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.generic import PaginatingMenu
@@ -25,7 +31,7 @@ if TYPE_CHECKING:
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.playlist")
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 INF = float("inf")
 ASCII_ORDER_SORT = "~" * 100
 
@@ -54,29 +60,114 @@ class PlaylistPickerSource(menus.ListPageSource):
             text=_("Page {page_num}/{total_pages} | {num} playlists").format(
                 page_num=humanize_number(page_num + 1),
                 total_pages=humanize_number(self.get_max_pages()),
-                num=len(self.entries),
+                num=self.playlist_count,
             )
         )
         return page
 
+    @property
+    def playlist_count(self) -> int:
+        return len(self.entries)
+
+    async def fetch_playlists(self, page_number: int) -> list[PlaylistModel]:
+        base = page_number * self.per_page
+        return self.entries[base : base + self.per_page]  # noqa: E203
+
     async def get_page(self, page_number):
         if page_number > self.get_max_pages():
             page_number = 0
         base = page_number * self.per_page
-        self.select_options.clear()
+        playlists = await self.fetch_playlists(page_number)
+        metadata = await fetch_playlist_metadata(playlists)
+        options = await build_options(
+            playlists,
+            lambda playlist, i: PlaylistOption.from_playlist(
+                playlist=playlist, index=i, bot=self.cog.bot, metadata=metadata[playlist.id]
+            ),
+            start=base,
+        )
+        self.select_options[:] = options
         self.select_mapping.clear()
-        async for i, playlist in asyncstdlib.enumerate(
-            asyncstdlib.iter(self.entries[base : base + self.per_page]), start=base
-        ):  # noqa: E203
-            self.select_options.append(await PlaylistOption.from_playlist(playlist=playlist, index=i, bot=self.cog.bot))
-            self.select_mapping[f"{playlist.id}"] = playlist
-        return self.entries[base : base + self.per_page]  # noqa: E203
+        self.select_mapping.update((f"{playlist.id}", playlist) for playlist in playlists)
+        return playlists
 
     def get_max_pages(self):
         """:class:`int`: The maximum number of pages required to paginate this sequence"""
         return self._max_pages or 1
 
 
+class ScopedPlaylistPickerSource(PlaylistPickerSource):
+    """A :class:`PlaylistPickerSource` over every playlist in the given scopes, read from the database a page at a time.
+
+    Pages are fetched by keyset pagination on the playlist id, so only the last few pages visited are kept in memory
+    and opening the picker doesn't load every playlist the bot has.
+    """
+
+    def __init__(self, guild_id: int, cog: CogT, scopes: list[int], message_str: str, window: int = 3):  # noqa
+        self.message_str = message_str
+        self.per_page = 5
+        self.guild_id = guild_id
+        self.select_options: list[PlaylistOption] = []
+        self.cog = cog
+        self.select_mapping: dict[str, PlaylistModel] = {}
+        self.scopes = list(scopes)
+        self._count = 0
+        self._recount = True
+        self._pages: LRUCache[int, list[PlaylistModel]] = LRUCache(maxsize=window)
+        # The id of the last playlist on each page that has been fetched, where the next page starts from
+        self._cursors: dict[int, int] = {}
+
+    @property
+    def playlist_count(self) -> int:
+        return self._count
+
+    def is_paginating(self) -> bool:
+        return True
+
+    async def _fetch_ids(self, page_number: int) -> list[int]:
+        if page_number == 0:
+            query = "SELECT id FROM playlist WHERE scope = ANY({}) ORDER BY id LIMIT {};"
+            rows = await PlaylistRow.raw(query, self.scopes, self.per_page)
+        elif (cursor := self._cursors.get(page_number - 1)) is not None:
+            query = "SELECT id FROM playlist WHERE scope = ANY({}) AND id > {} ORDER BY id LIMIT {};"
+            rows = await PlaylistRow.raw(query, self.scopes, cursor, self.per_page)
+        elif page_number == self.get_max_pages() - 1:
+            # Jumping to the last page, it holds whatever is left over, so it can be read backwards from the end
+            query = "SELECT id FROM playlist WHERE scope = ANY({}) ORDER BY id DESC LIMIT {};"
+            remainder = self.playlist_count - page_number * self.per_page
+            rows = (await PlaylistRow.raw(query, self.scopes, remainder))[::-1]
+        else:
+            query = "SELECT id FROM playlist WHERE scope = ANY({}) ORDER BY id LIMIT {} OFFSET {};"
+            rows = await PlaylistRow.raw(query, self.scopes, self.per_page, page_number * self.per_page)
+        return [row["id"] for row in rows]
+
+    async def fetch_playlists(self, page_number: int) -> list[PlaylistModel]:
+        if self._recount:
+            rows = await PlaylistRow.raw("SELECT COUNT(*) AS count FROM playlist WHERE scope = ANY({});", self.scopes)
+            self._count = rows[0]["count"] if rows else 0
+            self._recount = False
+        if (playlists := self._pages.get(page_number)) is None:
+            ids = await self._fetch_ids(page_number)
+            playlists = [self.cog.lavalink.playlist_db_manager.get_playlist(id=playlist_id) for playlist_id in ids]
+            self._pages.put(page_number, playlists)
+            if ids:
+                self._cursors[page_number] = ids[-1]
+        return playlists
+
+    def invalidate(self) -> None:
+        """Forget the fetched pages and count, so the next page is read fresh from the database"""
+        self._recount = True
+        self._pages.clear()
+        self._cursors.clear()
+
+    def get_max_pages(self):
+        """:class:`int`: The maximum number of pages required to paginate this sequence"""
+        pages, left_over = divmod(self.playlist_count, self.per_page)
+        if left_over:
+            pages += 1
+        return pages or 1
+
+
 class Base64Source(menus.ListPageSource):
     def __init__(
         self,
@@ -101,18 +192,29 @@ class Base64Source(menus.ListPageSource):
         start = page_num * self.per_page
         return start, page_num
 
+    async def _build_track(self, track: str) -> Track:
+        return Track(
+            node=random.choice(self.cog.lavalink.node_manager.nodes),
+            requester=self.author.id,
+            data=track,
+            query=await Query.from_base64(track),
+        )
+
+    def _decode_track(self, track: str) -> TrackMetadata | Awaitable[Track]:
+        try:
+            return decode_track_metadata(track)
+        except TRACK_DECODE_ERRORS:
+            # A format decode_track_metadata doesn't know, let PyLav decode it instead
+            return self._build_track(track)
+
     async def format_page(self, menu: PaginatingMenu, tracks: list[str]) -> discord.Embed:
         start_index, page_num = self.get_starting_index_and_page_number(menu)
         padding = len(str(start_index + len(tracks)))
         queue_list = ""
         async for track_idx, track in AsyncIter(tracks).enumerate(start=start_index + 1):
-            track = Track(
-                node=random.choice(self.cog.lavalink.node_manager.nodes),
-                requester=self.author.id,
-                data=track,
-                query=await Query.from_base64(track),
+            track_description = await fetch_track_display_name(
+                track, functools.partial(self._decode_track, track), max_length=50, with_url=True
             )
-            track_description = await track.get_track_display_name(max_length=50, with_url=True)
             diff = padding - len(str(track_idx))
             queue_list += f"`{track_idx}.{' ' * diff}` {track_description}\n"
         page = await self.cog.lavalink.construct_embed(
@@ -149,15 +251,17 @@ class PlaylistListSource(menus.ListPageSource):
         idx_start, page_num = self.get_starting_index_and_page_number(menu)
         plist = ""
         space = "\N{EN SPACE}"
-        async for i, playlist in AsyncIter(playlists).enumerate(start=idx_start + 1):
-            scope_name = await playlist.get_scope_name(self.cog.bot)
-            author_name = await playlist.get_author_name(self.cog.bot) or _("Unknown")
+        metadata = await fetch_playlist_metadata(playlists)
+        for i, playlist in enumerate(playlists, start=idx_start + 1):
+            data = metadata[playlist.id]
+            scope_name = data.get_scope_name(self.cog.bot)
+            author_name = data.get_author_name(self.cog.bot) or _("Unknown")
             is_same = scope_name == author_name
             playlist_info = ("\n" + space * 4).join(
                 (
-                    await playlist.get_name_formatted(with_url=True),
+                    data.get_name_formatted(with_url=True),
                     _("ID: {id}").format(id=playlist.id),
-                    _("Tracks: {num}").format(num=await playlist.size()),
+                    _("Tracks: {num}").format(num=data.size),
                     _("Author: {name}").format(name=author_name),
                     "\n" if is_same else _("Scope: {scope}\n").format(scope=scope_name),
                 )
@@ -1,26 +1,41 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+import collections
+import itertools
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
-import asyncstdlib
 import discord
 from red_commons.logging import getLogger
-from redbot.core.i18n import Translator
 from redbot.vendored.discord.ext import menus
 
 from pylav.tracks import Track
 from pylav.types import CogT
 
+from pylavcogs_shared.i18n import SharedTranslator
 from pylavcogs_shared.ui.selectors.options.queue import QueueTrackOption, SearchTrackOption
+from pylavcogs_shared.utils.caching import fetch_queue_page, invalidate_queue_pages, queue_version
+from pylavcogs_shared.utils.concurrency import build_options
 
 if TYPE_CHECKING:
     from pylavcogs_shared.ui.menus.queue import QueueMenu, QueuePickerMenu
 
 LOGGER = getLogger("red.3pt.PyLav-Shared.ui.sources.queue")
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+T = TypeVar("T")
+
+
+def _fetch_page(entries: Iterable[T], start: int, stop: int) -> list[T]:
+    """Get ``entries[start:stop]``, indexing straight into the entries rather than walking them when possible"""
+    if isinstance(entries, collections.deque):
+        # Deques can't be sliced, but indexing them only walks their internal blocks
+        return [entries[i] for i in range(start, min(stop, len(entries)))]
+    if isinstance(entries, Sequence):
+        return list(entries[start:stop])
+    return list(itertools.islice(entries, start, stop))
 
 
 class SearchPickerSource(menus.ListPageSource):
@@ -37,13 +52,13 @@ class SearchPickerSource(menus.ListPageSource):
         if page_number > self.get_max_pages():
             page_number = 0
         base = page_number * self.per_page
-        self.select_options.clear()
+        tracks = self.entries[base : base + self.per_page]  # noqa: E203
+        options = await build_options(
+            tracks, lambda track, i: SearchTrackOption.from_track(track=track, index=i), start=base
+        )
+        self.select_options[:] = options
         self.select_mapping.clear()
-        async for i, track in asyncstdlib.enumerate(
-            asyncstdlib.iter(self.entries[base : base + self.per_page]), start=base
-        ):  # noqa: E203
-            self.select_options.append(await SearchTrackOption.from_track(track=track, index=i))
-            self.select_mapping[track.id] = track
+        self.select_mapping.update((track.id, track) for track in tracks)
         return []
 
     async def format_page(self, menu: QueueMenu, entries: list[Track]) -> str:
@@ -71,9 +86,18 @@ class QueueSource(menus.ListPageSource):
     def is_paginating(self) -> bool:
         return True
 
+    def data_version(self) -> tuple | None:
+        """Changes whenever the pages of this source would change, used to discard prefetched pages"""
+        if player := self.cog.lavalink.get_player(self.guild_id):
+            return queue_version(player)
+
+    def invalidate(self) -> None:
+        """Forget the rendered queue pages of this guild, so the next page is built fresh"""
+        invalidate_queue_pages(self.guild_id)
+
     async def get_page(self, page_number: int) -> list[Track]:
         base = page_number * self.per_page
-        return await asyncstdlib.list(asyncstdlib.islice(self.entries, base, base + self.per_page))
+        return _fetch_page(self.entries, base, base + self.per_page)
 
     def get_max_pages(self) -> int:
         player = self.cog.lavalink.get_player(self.guild_id)
@@ -93,11 +117,11 @@ class QueueSource(menus.ListPageSource):
     async def format_page(self, menu: QueueMenu, tracks: list[Track]) -> discord.Embed:
         if player := self.cog.lavalink.get_player(menu.ctx.guild.id):
             return (
-                await player.get_queue_page(
+                await fetch_queue_page(
+                    player,
                     page_index=menu.current_page,
                     per_page=self.per_page,
                     total_pages=self.get_max_pages(),
-                    embed=True,
                     messageable=menu.ctx,
                     history=self.history,
                 )
@@ -127,23 +151,23 @@ class QueuePickerSource(QueueSource):
         if page_number > self.get_max_pages():
             page_number = 0
         base = page_number * self.per_page
-        self.select_options.clear()
+        tracks = _fetch_page(self.entries, base, base + self.per_page)
+        options = await build_options(
+            tracks, lambda track, i: QueueTrackOption.from_track(track=track, index=i), start=base
+        )
+        self.select_options[:] = options
         self.select_mapping.clear()
-        async for i, track in asyncstdlib.enumerate(
-            asyncstdlib.islice(self.entries, base, base + self.per_page), start=base
-        ):
-            self.select_options.append(await QueueTrackOption.from_track(track=track, index=i))
-            self.select_mapping[track.id] = track
+        self.select_mapping.update((track.id, track) for track in tracks)
         return []
 
     async def format_page(self, menu: QueuePickerMenu, tracks: list[Track]) -> discord.Embed:
         if player := self.cog.lavalink.get_player(menu.ctx.guild.id):
             return (
-                await player.get_queue_page(
+                await fetch_queue_page(
+                    player,
                     page_index=menu.current_page,
                     per_page=self.per_page,
                     total_pages=self.get_max_pages(),
-                    embed=True,
                     messageable=menu.ctx,
                 )
                 if player.current
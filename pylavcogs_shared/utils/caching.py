@@ -0,0 +1,550 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import functools
+import inspect
+import re
+import sys
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Mapping
+from typing import Any, Generic, TypeVar
+
+import discord
+from red_commons.logging import getLogger
+from redbot.core.i18n import get_locale
+
+from pylav.client import Client
+from pylav.events import (
+    Event,
+    NodeConnectedEvent,
+    PlayerDisconnectedEvent,
+    PlayerPausedEvent,
+    PlayerRepeatEvent,
+    PlayerResumedEvent,
+    PlayerStoppedEvent,
+    QueueEndEvent,
+    QueueShuffledEvent,
+    QueueTrackPositionChangedEvent,
+    QueueTracksRemovedEvent,
+    TrackAutoPlayEvent,
+    TrackPreviousRequestedEvent,
+    TrackSeekEvent,
+    TrackSkippedEvent,
+    TracksRequestedEvent,
+    TrackStartEvent,
+)
+from pylav.node import Node
+from pylav.player import Player
+from pylav.sql.models import PlayerModel
+from pylav.tracks import Track
+from pylav.types import BotT, InteractionT
+from pylav.utils import PyLavContext
+
+from pylavcogs_shared.utils.node_stats import NODE_STATS
+from pylavcogs_shared.utils.tracks import TrackMetadata
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.caching")
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class LRUCache(Generic[KT, VT]):
+    """A bounded least-recently-used mapping which keeps track of its hit and miss counts.
+
+    Entries are evicted oldest-first once ``maxsize`` is exceeded,
+    or once the entries add up to more than ``maxbytes`` as measured by ``sizeof(key, value)``.
+    If ``ttl`` is set, entries older than ``ttl`` seconds are treated as misses.
+    """
+
+    __slots__ = ("_data", "maxsize", "maxbytes", "sizeof", "ttl", "hits", "misses", "evictions", "nbytes")
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        *,
+        maxbytes: int | None = None,
+        sizeof: Callable[[KT, VT], int] | None = None,
+    ) -> None:
+        self._data: collections.OrderedDict[KT, tuple[float, VT, int]] = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: KT) -> bool:
+        return self.get(key, _MISSING, count=False) is not _MISSING
+
+    def get(self, key: KT, default: Any = None, *, count: bool = True) -> VT | Any:
+        try:
+            stored_at, value, __ = self._data[key]
+        except KeyError:
+            if count:
+                self.misses += 1
+            return default
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            self.nbytes -= self._data.pop(key)[2]
+            if count:
+                self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        if count:
+            self.hits += 1
+        return value
+
+    def put(self, key: KT, value: VT) -> None:
+        size = self.sizeof(key, value) if self.sizeof is not None else 0
+        if self.maxbytes is not None and size > self.maxbytes:
+            self.pop(key)
+            return
+        if key in self._data:
+            self.nbytes -= self._data[key][2]
+        self._data[key] = (time.monotonic(), value, size)
+        self._data.move_to_end(key)
+        self.nbytes += size
+        while len(self._data) > self.maxsize or (self.maxbytes is not None and self.nbytes > self.maxbytes):
+            self.nbytes -= self._data.popitem(last=False)[1][2]
+            self.evictions += 1
+
+    def pop(self, key: KT, default: Any = None) -> VT | Any:
+        try:
+            __, value, size = self._data.pop(key)
+        except KeyError:
+            return default
+        self.nbytes -= size
+        return value
+
+    def discard_where(self, predicate: Callable[[KT], bool]) -> int:
+        """Remove every entry whose key matches the predicate, returning how many were removed"""
+        keys = [key for key in self._data if predicate(key)]
+        for key in keys:
+            self.nbytes -= self._data.pop(key)[2]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.nbytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, int | float | None]:
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+# Entries are dropped when PlayerModel.update_text_channel_id writes the lock, see _WRITE_HOOKS,
+# the TTL only catches changes made by anything else, such as another process sharing the database
+CHANNEL_LOCK_CACHE: LRUCache[int, int] = LRUCache(maxsize=2048, ttl=60)
+
+
+async def fetch_channel_lock(guild_id: int, config: PlayerModel) -> int:
+    """Get the command channel lock for a guild, only hitting the database when it isn't cached.
+
+    Returns 0 if commands are not locked to any channel.
+    The cached lock is dropped whenever :meth:`PlayerModel.update_text_channel_id` changes it,
+    anything writing the setting some other way should call :func:`invalidate_channel_lock` afterwards.
+    """
+    channel_id = CHANNEL_LOCK_CACHE.get(guild_id, _MISSING)
+    if channel_id is _MISSING:
+        channel_id = await config.fetch_text_channel_id()
+        CHANNEL_LOCK_CACHE.put(guild_id, channel_id)
+    return channel_id
+
+
+def invalidate_channel_lock(guild_id: int | None = None) -> None:
+    """Drop the cached command channel lock for a guild, or for every guild if ``guild_id`` is None."""
+    if guild_id is None:
+        CHANNEL_LOCK_CACHE.clear()
+    else:
+        CHANNEL_LOCK_CACHE.pop(guild_id)
+
+
+# Keyed by (locale, function), so nothing needs to be dropped when the locale changes
+RENDER_CONSTANTS: LRUCache[tuple[str, Callable[[], Any]], Any] = LRUCache(maxsize=512)
+
+
+def locale_cached(func: Callable[[], T]) -> Callable[[], T]:
+    """Cache the result of a function which builds render constants, such as painted table headers, per locale.
+
+    The ``_()`` calls stay inside the decorated function, so redgettext still extracts the strings.
+    The cached value is shared by every caller and must not be mutated.
+    """
+
+    @functools.wraps(func)
+    def wrapper() -> T:
+        key = (get_locale(), func)
+        value = RENDER_CONSTANTS.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            RENDER_CONSTANTS.put(key, value)
+        return value
+
+    return wrapper
+
+
+# Keyed by (guild id, user id), set ``DJ_CACHE.ttl`` to change how long a DJ decision is trusted for.
+# A guild's entries are dropped when PlayerModel writes its DJ users or roles, see _WRITE_HOOKS.
+DJ_CACHE: LRUCache[tuple[int, int], bool] = LRUCache(maxsize=4096, ttl=60)
+
+
+def invalidate_dj(guild_id: int | None = None, user_id: int | None = None) -> None:
+    """Drop cached DJ decisions.
+
+    They are dropped whenever one of the :class:`PlayerModel` DJ user or role setters runs for the guild,
+    anything changing them some other way should call this with the guild id afterwards.
+    """
+    if guild_id is None and user_id is None:
+        DJ_CACHE.clear()
+    elif user_id is None:
+        DJ_CACHE.discard_where(lambda key: key[0] == guild_id)
+    elif guild_id is None:
+        DJ_CACHE.discard_where(lambda key: key[1] == user_id)
+    else:
+        DJ_CACHE.pop((guild_id, user_id))
+
+
+# Keyed by (guild id, queue version, history, page index, per page, locale).
+# The pages include the position of the current track, so they are only reused for a few seconds.
+QUEUE_PAGE_CACHE: LRUCache[tuple[int, tuple, bool, int, int, str], discord.Embed] = LRUCache(maxsize=256, ttl=5)
+_QUEUE_VERSIONS: collections.Counter[int] = collections.Counter()
+
+
+def queue_version(player: Player) -> tuple[int, str | None, int, int, bool]:
+    """A value which changes whenever the queue or history of the player changes"""
+    return (
+        _QUEUE_VERSIONS[player.guild.id],
+        player.current.id if player.current else None,
+        player.queue.size(),
+        player.history.size(),
+        player.paused,
+    )
+
+
+def invalidate_queue_pages(guild_id: int | None = None) -> None:
+    """Drop the rendered queue pages of a guild, or of every guild if ``guild_id`` is None.
+
+    Call this after changing a queue in a way that doesn't dispatch a PyLav event.
+    """
+    if guild_id is None:
+        _QUEUE_VERSIONS.clear()
+        QUEUE_PAGE_CACHE.clear()
+    else:
+        _QUEUE_VERSIONS[guild_id] += 1
+        QUEUE_PAGE_CACHE.discard_where(lambda key: key[0] == guild_id)
+
+
+async def fetch_queue_page(
+    player: Player,
+    page_index: int,
+    per_page: int,
+    total_pages: int,
+    messageable: PyLavContext | InteractionT,
+    history: bool = False,
+) -> discord.Embed:
+    """Get a rendered queue page, reusing the one rendered for anyone else looking at the same page"""
+    key = (player.guild.id, queue_version(player), history, page_index, per_page, get_locale())
+    if (page := QUEUE_PAGE_CACHE.get(key)) is None:
+        page = await player.get_queue_page(
+            page_index=page_index,
+            per_page=per_page,
+            total_pages=total_pages,
+            embed=True,
+            messageable=messageable,
+            history=history,
+        )
+        QUEUE_PAGE_CACHE.put(key, page)
+    return page.copy()
+
+
+def _display_name_size(key: tuple[str, int | None, bool, bool, bool], value: str) -> int:
+    return sys.getsizeof(key[0]) + sys.getsizeof(value)
+
+
+# Keyed by (base64 track, max length, author, unformatted, with url), shared by every view listing tracks.
+TRACK_DISPLAY_CACHE: LRUCache[tuple[str, int | None, bool, bool, bool], str] = LRUCache(
+    maxsize=8192, maxbytes=8 * 1024 * 1024, sizeof=_display_name_size
+)
+
+
+async def fetch_track_display_name(
+    encoded: str | None,
+    track: Track | TrackMetadata | Callable[[], Track | TrackMetadata | Awaitable[Track]],
+    *,
+    max_length: int | None = None,
+    author: bool = True,
+    unformatted: bool = False,
+    with_url: bool = False,
+) -> str:
+    """Get the display name of a track, only building and rendering the track when it isn't cached.
+
+    ``track`` is either the track itself or a function which builds it from ``encoded``.
+    Streams and partial tracks aren't cached, as their display names can change.
+    """
+    key = (encoded, max_length, author, unformatted, with_url)
+    if encoded and (name := TRACK_DISPLAY_CACHE.get(key)) is not None:
+        return name
+    if callable(track):
+        track = track()
+        if inspect.isawaitable(track):
+            track = await track
+    options = dict(max_length=max_length, author=author, unformatted=unformatted, with_url=with_url)
+    if isinstance(track, TrackMetadata):
+        name = track.get_track_display_name(**options)
+    else:
+        name = await track.get_track_display_name(**options)
+        if track.is_partial:
+            return name
+    if encoded and not track.stream:
+        TRACK_DISPLAY_CACHE.put(key, name)
+    return name
+
+
+# Keyed by node identifier, the values are (refresh after, plugins).
+# Stale entries are still served while a refresh runs in the background, they are refreshed PLUGIN_TTL after a
+# successful fetch, or PLUGIN_FAILURE_TTL after a failed one so a node that was briefly unreachable recovers quickly.
+PLUGIN_CACHE: LRUCache[int, tuple[float, list[dict]]] = LRUCache(maxsize=256)
+PLUGIN_TTL = 600.0
+PLUGIN_FAILURE_TTL = 30.0
+_PLUGIN_REFRESHES: dict[int, asyncio.Task] = {}
+
+
+async def _fetch_node_plugins(node: Node) -> None:
+    try:
+        plugins = await node.get_plugins()
+    except Exception as exc:
+        LOGGER.debug("Failed to fetch the plugins of node %s: %s", node.name, exc)
+        # Don't retry a failing node on every render, it'll be tried again shortly or when it reconnects
+        PLUGIN_CACHE.put(node.identifier, (time.monotonic() + PLUGIN_FAILURE_TTL, []))
+    else:
+        PLUGIN_CACHE.put(node.identifier, (time.monotonic() + PLUGIN_TTL, plugins))
+
+
+def _forget_plugin_refresh(identifier: int, task: asyncio.Task) -> None:
+    if _PLUGIN_REFRESHES.get(identifier) is task:
+        del _PLUGIN_REFRESHES[identifier]
+
+
+def refresh_node_plugins(node: Node) -> asyncio.Task:
+    """Fetch the plugins of a node in the background, unless they are already being fetched"""
+    if (task := _PLUGIN_REFRESHES.get(node.identifier)) is None or task.done():
+        task = _PLUGIN_REFRESHES[node.identifier] = asyncio.create_task(_fetch_node_plugins(node))
+        task.add_done_callback(functools.partial(_forget_plugin_refresh, node.identifier))
+    return task
+
+
+def get_node_plugins(node: Node) -> list[dict] | None:
+    """Get the cached plugins of a node without waiting on the network, None if they haven't been fetched yet.
+
+    Missing and expired entries are refreshed in the background.
+    """
+    if (entry := PLUGIN_CACHE.get(node.identifier)) is None:
+        refresh_node_plugins(node)
+        return None
+    refresh_at, plugins = entry
+    if time.monotonic() > refresh_at:
+        refresh_node_plugins(node)
+    return plugins
+
+
+# Keyed by node identifier, each entry is the visible fields of the node's page and its rendered table.
+NODE_PAGE_CACHE: LRUCache[int, tuple[tuple, str]] = LRUCache(maxsize=256)
+
+
+def cache_stats() -> dict[str, dict[str, int | float | None]]:
+    """The size and hit rate of each of the shared caches"""
+    return {
+        "channel_lock": CHANNEL_LOCK_CACHE.stats(),
+        "render_constants": RENDER_CONSTANTS.stats(),
+        "dj": DJ_CACHE.stats(),
+        "queue_pages": QUEUE_PAGE_CACHE.stats(),
+        "track_display": TRACK_DISPLAY_CACHE.stats(),
+        "node_plugins": PLUGIN_CACHE.stats(),
+        "node_pages": NODE_PAGE_CACHE.stats(),
+        "node_stats": NODE_STATS.stats(),
+    }
+
+
+async def _on_queue_changed(event: Event) -> None:
+    if player := getattr(event, "player", None):
+        invalidate_queue_pages(player.guild.id)
+
+
+async def _on_node_connected(event: Event) -> None:
+    if node := getattr(event, "node", None):
+        refresh_node_plugins(node)
+
+
+async def _on_member_update(before: discord.Member, after: discord.Member) -> None:
+    if before.roles != after.roles:
+        invalidate_dj(after.guild.id, after.id)
+
+
+async def _on_guild_role_delete(role: discord.Role) -> None:
+    invalidate_dj(role.guild.id)
+
+
+async def _on_guild_remove(guild: discord.Guild) -> None:
+    invalidate_channel_lock(guild.id)
+    invalidate_dj(guild.id)
+    invalidate_queue_pages(guild.id)
+    _QUEUE_VERSIONS.pop(guild.id, None)
+
+
+_LISTENERS: list[tuple[str, Callable[..., Coroutine[Any, Any, None]]]] = [
+    ("on_member_update", _on_member_update),
+    ("on_guild_role_delete", _on_guild_role_delete),
+    ("on_guild_remove", _on_guild_remove),
+]
+_EVENT_LISTENERS: list[tuple[type[Event], Callable[..., Coroutine[Any, Any, None]]]] = [
+    (NodeConnectedEvent, _on_node_connected),
+    *(
+        (event, _on_queue_changed)
+        for event in (
+            QueueEndEvent,
+            QueueShuffledEvent,
+            QueueTrackPositionChangedEvent,
+            QueueTracksRemovedEvent,
+            TracksRequestedEvent,
+            TrackStartEvent,
+            # PyLav dispatches the source specific subclass instead of TrackStartEvent when there is one
+            *TrackStartEvent.__subclasses__(),
+            TrackSkippedEvent,
+            TrackSeekEvent,
+            TrackPreviousRequestedEvent,
+            TrackAutoPlayEvent,
+            PlayerPausedEvent,
+            PlayerResumedEvent,
+            PlayerStoppedEvent,
+            PlayerDisconnectedEvent,
+            PlayerRepeatEvent,
+        )
+    ),
+]
+
+
+def _pylav_event_names(client: Client) -> Mapping[type[Event], str]:
+    """The names the client dispatches its events under, read from its dispatch manager"""
+    mapping = getattr(getattr(client, "_dispatch_manager", None), "mapping", None)
+    if not isinstance(mapping, Mapping):
+        LOGGER.debug("PyLav's event mapping isn't available, falling back to the event class names")
+        return {}
+    return mapping
+
+
+def _event_listener_name(event: type[Event], names: Mapping[type[Event], str]) -> str:
+    """The listener name Red will call for ``event``"""
+    if (name := names.get(event)) is None:
+        name = f"pylav_{re.sub(r'(?<!^)(?=[A-Z])', '_', event.__name__).lower()}"
+    return f"on_{name}"
+
+
+_ATTACHED_LISTENERS: list[tuple[str, Callable[..., Coroutine[Any, Any, None]]]] = []
+_LISTENING_BOT: BotT | None = None
+
+# The PlayerModel methods which write a cached setting, and what to drop for the guild once they have run
+_WRITE_HOOKS: dict[str, Callable[[int], None]] = {
+    "update_text_channel_id": invalidate_channel_lock,
+    **dict.fromkeys(
+        (
+            "add_to_dj_users",
+            "remove_from_dj_users",
+            "bulk_add_dj_users",
+            "bulk_remove_dj_users",
+            "dj_users_reset",
+            "add_to_dj_roles",
+            "remove_from_dj_roles",
+            "bulk_add_dj_roles",
+            "bulk_remove_dj_roles",
+            "dj_roles_reset",
+        ),
+        invalidate_dj,
+    ),
+}
+_HOOKED_METHODS: dict[str, Callable[..., Coroutine[Any, Any, Any]]] = {}
+
+
+def _invalidate_after(
+    method: Callable[..., Coroutine[Any, Any, T]], invalidate: Callable[[int], None]
+) -> Callable[..., Coroutine[Any, Any, T]]:
+    @functools.wraps(method)
+    async def wrapper(self: PlayerModel, *args: Any, **kwargs: Any) -> T:
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            invalidate(self.id)
+
+    return wrapper
+
+
+def _hook_config_writes() -> None:
+    """Wrap the PlayerModel setters so the shared caches are dropped as soon as a setting is written"""
+    for name, invalidate in _WRITE_HOOKS.items():
+        if name not in _HOOKED_METHODS and (method := getattr(PlayerModel, name, None)) is not None:
+            _HOOKED_METHODS[name] = method
+            setattr(PlayerModel, name, _invalidate_after(method, invalidate))
+
+
+def _unhook_config_writes() -> None:
+    for name, method in _HOOKED_METHODS.items():
+        setattr(PlayerModel, name, method)
+    _HOOKED_METHODS.clear()
+
+
+def attach_cache_listeners(bot: BotT, client: Client) -> None:
+    """Register the listeners which keep the shared caches in sync with Discord and PyLav's events"""
+    global _LISTENING_BOT
+    if _LISTENING_BOT is bot:
+        return
+    detach_cache_listeners()
+    names = _pylav_event_names(client)
+    # Several event classes can share a dispatch name, so only register each listener once per name
+    _ATTACHED_LISTENERS[:] = dict.fromkeys(
+        [*_LISTENERS, *((_event_listener_name(event, names), listener) for event, listener in _EVENT_LISTENERS)]
+    )
+    for name, listener in _ATTACHED_LISTENERS:
+        bot.add_listener(listener, name)
+    _hook_config_writes()
+    _LISTENING_BOT = bot
+
+
+def detach_cache_listeners() -> None:
+    """Remove the cache listeners and drop every cached value"""
+    global _LISTENING_BOT
+    if _LISTENING_BOT is None:
+        return
+    for name, listener in _ATTACHED_LISTENERS:
+        _LISTENING_BOT.remove_listener(listener, name)
+    _ATTACHED_LISTENERS.clear()
+    _unhook_config_writes()
+    _LISTENING_BOT = None
+    CHANNEL_LOCK_CACHE.clear()
+    invalidate_dj()
+    invalidate_queue_pages()
+    TRACK_DISPLAY_CACHE.clear()
+    for task in _PLUGIN_REFRESHES.values():
+        task.cancel()
+    PLUGIN_CACHE.clear()
+    NODE_PAGE_CACHE.clear()
@@ -0,0 +1,170 @@
+"""Compile the ``.po`` translation catalogs into ``.mo`` files and read them back without parsing.
+
+This module only depends on the standard library so it can be run as a build step::
+
+    python -m pylavcogs_shared.utils.catalogs
+"""
+from __future__ import annotations
+
+import array
+import contextlib
+import hashlib
+import mmap
+import struct
+import sys
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+
+_MSGID = 'msgid "'
+_MSGSTR = 'msgstr "'
+_MO_MAGIC = 0x950412DE
+_MO_HEADER = struct.Struct("<7I")
+# The digest of the .po a catalog was compiled from is stored as the translation of an empty message in this context,
+# file modification times can't be used to tell if a .mo is stale as they aren't kept when a wheel is installed
+_SOURCE_DIGEST_KEY = "pylav-source-sha256\x04"
+
+
+def _unescape(string: str) -> str:
+    return (
+        string.replace(r"\\", "\\").replace(r"\t", "\t").replace(r"\r", "\r").replace(r"\n", "\n").replace(r"\"", '"')
+    )
+
+
+def read_po(path: Path) -> dict[str, str]:
+    """Parse a ``.po`` file the same way Red does, empty translations are omitted"""
+    translations = {}
+    in_msgstr = False
+    untranslated = translated = ""
+    with path.open(encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line.startswith(_MSGID):
+                if in_msgstr and translated:
+                    translations[_unescape(untranslated)] = _unescape(translated)
+                in_msgstr = False
+                untranslated = line[len(_MSGID) : -1]
+            elif line.startswith('"') and line.endswith('"'):
+                if in_msgstr:
+                    translated += line[1:-1]
+                else:
+                    untranslated += line[1:-1]
+            elif line.startswith(_MSGSTR):
+                in_msgstr = True
+                translated = line[len(_MSGSTR) : -1]
+    if in_msgstr and translated:
+        translations[_unescape(untranslated)] = _unescape(translated)
+    return translations
+
+
+def po_digest(path: Path) -> str:
+    """The digest of a ``.po`` file, as stored in the ``.mo`` file compiled from it"""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_mo(path: Path, translations: Mapping[str, str], source_digest: str | None = None) -> None:
+    """Write a GNU ``.mo`` file with the messages sorted so they can be binary searched.
+
+    ``source_digest`` is the :func:`po_digest` of the ``.po`` file the translations were read from, if any.
+    """
+    if source_digest is not None:
+        translations = {**translations, _SOURCE_DIGEST_KEY: source_digest}
+    entries = sorted((k.encode("utf-8"), v.encode("utf-8")) for k, v in translations.items())
+    count = len(entries)
+    ids_offset = _MO_HEADER.size
+    strs_offset = ids_offset + count * 8
+    data_offset = strs_offset + count * 8
+    ids = b"".join(key + b"\0" for key, __ in entries)
+    offsets = array.array("I")
+    position = data_offset
+    for key, __ in entries:
+        offsets.extend((len(key), position))
+        position += len(key) + 1
+    for __, value in entries:
+        offsets.extend((len(value), position))
+        position += len(value) + 1
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    path.write_bytes(
+        _MO_HEADER.pack(_MO_MAGIC, 0, count, ids_offset, strs_offset, 0, data_offset)
+        + offsets.tobytes()
+        + ids
+        + b"".join(value + b"\0" for __, value in entries)
+    )
+
+
+class MoCatalog(Mapping[str, str]):
+    """A read-only view of a ``.mo`` file.
+
+    The file is memory-mapped and messages are looked up with a binary search over the sorted ids,
+    so nothing is decoded until it is asked for and the pages are shared between processes.
+    """
+
+    __slots__ = ("_mmap", "_count", "_ids_offset", "_strs_offset")
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, __, self._count, self._ids_offset, self._strs_offset, __, __ = _MO_HEADER.unpack_from(self._mmap)
+        if magic != _MO_MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a little-endian .mo file")
+
+    def _entry(self, table: int, index: int) -> bytes:
+        length, offset = struct.unpack_from("<2I", self._mmap, table + index * 8)
+        return self._mmap[offset : offset + length]
+
+    def _find(self, key: bytes) -> int:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._entry(self._ids_offset, middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self._count and self._entry(self._ids_offset, low) == key else -1
+
+    def __getitem__(self, key: str) -> str:
+        if (index := self._find(key.encode("utf-8"))) == -1:
+            raise KeyError(key)
+        return self._entry(self._strs_offset, index).decode("utf-8")
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._find(key.encode("utf-8")) != -1
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._entry(self._ids_offset, index).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def source_digest(self) -> str | None:
+        """The :func:`po_digest` of the ``.po`` file this catalog was compiled from, if it was recorded"""
+        return self.get(_SOURCE_DIGEST_KEY)
+
+    def close(self) -> None:
+        with contextlib.suppress(ValueError):
+            self._mmap.close()
+
+
+def compile_locales(root: Path) -> int:
+    """Compile every ``locales/*.po`` file under root into a ``.mo`` file next to it, returns how many were written"""
+    written = 0
+    for po_file in root.rglob("locales/*.po"):
+        mo_file = po_file.with_suffix(".mo")
+        digest = po_digest(po_file)
+        with contextlib.suppress(OSError, ValueError):
+            catalog = MoCatalog(mo_file)
+            up_to_date = catalog.source_digest == digest
+            catalog.close()
+            if up_to_date:
+                continue
+        write_mo(mo_file, read_po(po_file), digest)
+        written += 1
+    return written
+
+
+if __name__ == "__main__":
+    target = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(__file__).resolve().parent.parent
+    print(f"Compiled {compile_locales(target)} translation catalogs in {target}")
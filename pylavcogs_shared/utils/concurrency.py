@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar
+
+from red_commons.logging import getLogger
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.concurrency")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How many select options are built at once, a page never has more than 25 of them
+OPTION_CONCURRENCY = 10
+
+
+async def bounded_gather(aws: Iterable[Awaitable[R]], limit: int) -> list[R]:
+    """Await every awaitable with at most ``limit`` of them running at once, the results are in the same order"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(aw: Awaitable[R]) -> R:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(_run(aw) for aw in aws)))
+
+
+async def build_options(
+    items: Iterable[T],
+    factory: Callable[[T, int], Awaitable[R]],
+    *,
+    start: int = 0,
+    limit: int = OPTION_CONCURRENCY,
+) -> list[R]:
+    """Build a select option for each item by calling ``factory(item, index)``, with ``index`` counting from start.
+
+    The options are built concurrently, but are returned in the same order as the items.
+    """
+    return await bounded_gather((factory(item, i) for i, item in enumerate(items, start=start)), limit)
@@ -5,15 +5,106 @@ from pathlib import Path
 import discord
 from discord import app_commands
 from redbot.core import commands
-from redbot.core.i18n import Translator
 
-from pylav.types import InteractionT
+from pylav.client import Client
+from pylav.player import Player
+from pylav.sql.models import PlayerModel
+from pylav.types import BotT, InteractionT
 from pylav.utils import PyLavContext
 
 from pylavcogs_shared import errors
 from pylavcogs_shared.errors import NotDJError, UnauthorizedChannelError
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.caching import DJ_CACHE, fetch_channel_lock
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+_CHECK_STATE_KEY = "_pylav_check_state"
+_MISSING = object()
+
+
+class CheckState:
+    """The values resolved once per invocation and shared by all the stacked PyLav checks"""
+
+    __slots__ = ("bot", "client", "player", "author", "_config", "_is_dj")
+
+    def __init__(self, bot: BotT, client: Client | None, player: Player | None, author: discord.abc.User) -> None:
+        self.bot = bot
+        self.client = client
+        self.player = player
+        self.author = author
+        self._config = None
+        self._is_dj = _MISSING
+
+    def get_config(self, guild: discord.Guild) -> PlayerModel:
+        if self._config is None:
+            self._config = self.player.config if self.player else self.client.player_config_manager.get_config(guild.id)
+        return self._config
+
+
+async def get_check_state(context: PyLavContext | InteractionT) -> CheckState:
+    """Resolve the client, player and author for this invocation, memoized on the context"""
+    is_interaction = isinstance(context, discord.Interaction)
+    state = context.extras.get(_CHECK_STATE_KEY) if is_interaction else getattr(context, _CHECK_STATE_KEY, None)
+    if state is not None:
+        return state
+    if is_interaction:
+        if not context.response.is_done():
+            await context.response.defer(ephemeral=True)
+        bot = context.client
+        author = context.user
+    else:
+        bot = context.bot
+        author = context.author
+    _lavalink = getattr(bot, "lavalink", None)
+    player = _lavalink.get_player(context.guild) if _lavalink else None
+    state = CheckState(bot=bot, client=_lavalink, player=player, author=author)
+    if is_interaction:
+        context.extras[_CHECK_STATE_KEY] = state
+    else:
+        setattr(context, _CHECK_STATE_KEY, state)
+    return state
+
+
+async def _requires_player_predicate(context: PyLavContext | InteractionT) -> bool:
+    return await _check_player(context, await get_check_state(context))
+
+
+async def _check_player(context: PyLavContext | InteractionT, state: CheckState) -> bool:
+    if not state.client:
+        return False
+    if not state.player:
+        raise errors.MediaPlayerNotFoundError(context)
+    return True
+
+
+async def _command_channel_predicate(context: PyLavContext | InteractionT) -> bool:
+    return await _check_channel(context, await get_check_state(context))
+
+
+async def _check_channel(context: PyLavContext | InteractionT, state: CheckState) -> bool:
+    if not state.client:
+        return False
+    if not context.guild:
+        return True
+    config = state.get_config(context.guild)
+    if (channel_id := await fetch_channel_lock(context.guild.id, config)) != 0 and channel_id != context.channel.id:
+        raise UnauthorizedChannelError(channel=channel_id)
+    return True
+
+
+async def _invoker_is_dj_predicate(context: PyLavContext | InteractionT) -> bool:
+    return await _check_dj(context, await get_check_state(context))
+
+
+async def _check_dj(context: PyLavContext | InteractionT, state: CheckState) -> bool:
+    if state._is_dj is _MISSING:
+        state._is_dj = await is_dj_logic(context)
+    if state._is_dj is False:
+        raise NotDJError(
+            context,
+        )
+    return True
 
 
 def always_hidden(slash: bool = False):
@@ -24,52 +115,11 @@ def always_hidden(slash: bool = False):
 
 
 def requires_player(slash: bool = False):
-    async def pred(context: PyLavContext | InteractionT):
-        if isinstance(context, discord.Interaction):
-            if not context.response.is_done():
-                await context.response.defer(ephemeral=True)
-            bot = context.client
-            _lavalink = getattr(bot, "lavalink", None)
-            player = _lavalink.get_player(context.guild) if _lavalink else None
-        else:
-            bot = context.bot
-            _lavalink = getattr(bot, "lavalink", None)
-            player = _lavalink.get_player(context.guild) if _lavalink else None
-        if not _lavalink:
-            return False
-        if not player:
-            raise errors.MediaPlayerNotFoundError(context)
-        return True
-
-    return app_commands.check(pred) if slash else commands.check(pred)
+    return app_commands.check(_requires_player_predicate) if slash else commands.check(_requires_player_predicate)
 
 
 def can_run_command_in_channel(slash: bool = False):
-    async def pred(context: PyLavContext | InteractionT):
-        if isinstance(context, discord.Interaction):
-            if not context.response.is_done():
-                await context.response.defer(ephemeral=True)
-            bot = context.client
-            _lavalink = getattr(bot, "lavalink", None)
-            player = _lavalink.get_player(context.guild) if _lavalink else None
-        else:
-            bot = context.bot
-            _lavalink = getattr(bot, "lavalink", None)
-            player = _lavalink.get_player(context.guild) if _lavalink else None
-        if not _lavalink:
-            return False
-        if not context.guild:
-            return True
-        if player:
-            config = player.config
-        else:
-            config = bot.lavalink.player_config_manager.get_config(context.guild.id)
-
-        if (channel_id := await config.fetch_text_channel_id()) != 0 and channel_id != context.channel.id:
-            raise UnauthorizedChannelError(channel=channel_id)
-        return True
-
-    return app_commands.check(pred) if slash else commands.check(pred)
+    return app_commands.check(_command_channel_predicate) if slash else commands.check(_command_channel_predicate)
 
 
 async def is_dj_logic(context: PyLavContext | InteractionT) -> bool | None:
@@ -85,18 +135,50 @@ async def is_dj_logic(context: PyLavContext | InteractionT) -> bool | None:
 
     if not (getattr(bot, "lavalink", None) and guild):
         return False
-    return await bot.lavalink.is_dj(
-        user=author, guild=guild, additional_role_ids=None, additional_user_ids={*bot.owner_ids, guild.owner_id}, bot=bot  # type: ignore
-    )
+    if (is_dj := DJ_CACHE.get((guild.id, author.id))) is None:
+        is_dj = await bot.lavalink.is_dj(
+            user=author, guild=guild, additional_role_ids=None, additional_user_ids={*bot.owner_ids, guild.owner_id}, bot=bot  # type: ignore
+        )
+        DJ_CACHE.put((guild.id, author.id), is_dj)
+    return is_dj
 
 
 def invoker_is_dj(slash: bool = False):
+    return app_commands.check(_invoker_is_dj_predicate) if slash else commands.check(_invoker_is_dj_predicate)
+
+
+def pylav_checks(
+    *,
+    can_run_in_channel: bool = False,
+    player: bool = False,
+    dj: bool = False,
+    slash: bool = False,
+):
+    """Combine the PyLav checks into a single check.
+
+    The client, player, config and DJ status are resolved once per invocation
+    and shared by every enabled check, which are run in the order they are listed here.
+
+    Example:
+        >>> @pylav_checks(can_run_in_channel=True, player=True, dj=True)
+        ... async def command_skip(self, context: PyLavContext):
+        ...     ...
+    """
+    predicates = [
+        predicate
+        for enabled, predicate in (
+            (can_run_in_channel, _check_channel),
+            (player, _check_player),
+            (dj, _check_dj),
+        )
+        if enabled
+    ]
+
     async def pred(context: PyLavContext | InteractionT):
-        is_dj = await is_dj_logic(context)
-        if is_dj is False:
-            raise NotDJError(
-                context,
-            )
+        state = await get_check_state(context)
+        for predicate in predicates:
+            if not await predicate(context, state):
+                return False
         return True
 
     return app_commands.check(pred) if slash else commands.check(pred)
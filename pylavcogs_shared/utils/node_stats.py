@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import array
+import asyncio
+import math
+import time
+from pathlib import Path
+
+import aiohttp
+from red_commons.logging import getLogger
+
+from pylav.client import Client
+from pylav.node import Node
+
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.concurrency import bounded_gather
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.node_stats")
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+# The order of the metrics within each sample
+METRICS = ("lavalink_load", "frames_lost", "memory_used", "penalty")
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+
+# How long a node has to answer a probe before it's reported as timed out
+PROBE_TIMEOUT = 5.0
+PROBE_CONCURRENCY = 10
+# What probe results can be sorted by, best first
+PROBE_SORT_KEYS = ("latency", "penalty", "frames_lost", "name")
+
+
+class NodeStatsHistory:
+    """A fixed-size ring buffer of stats samples for a single node.
+
+    The samples are stored in a flat ``array`` of 32-bit floats, one slot per metric per sample,
+    so a node costs the same amount of memory however long it has been recorded for.
+    Samples taken while the node had no stats are recorded as NaN.
+    """
+
+    __slots__ = ("capacity", "revision", "_samples", "_next", "_count")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        # Incremented on every sample, so renders of the history can be cached until the next one
+        self.revision = 0
+        self._samples = array.array("f", bytes(4 * capacity * len(METRICS)))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return self._samples.itemsize * len(self._samples)
+
+    def record(self, node: Node) -> None:
+        if stats := node.stats:
+            frames_lost = (abs(stats.frames_deficit) + abs(stats.frames_nulled)) / (stats.frames_sent or 1) * 100
+            values = (stats.lavalink_load, frames_lost, stats.memory_used, node.penalty - 1)
+        else:
+            values = (math.nan,) * len(METRICS)
+        start = self._next * len(METRICS)
+        self._samples[start : start + len(METRICS)] = array.array("f", values)
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.revision += 1
+
+    def values(self, metric: str) -> list[float]:
+        """The samples of a metric, oldest first"""
+        index = METRICS.index(metric)
+        first = (self._next - self._count) % self.capacity
+        return [
+            self._samples[((first + offset) % self.capacity) * len(METRICS) + index] for offset in range(self._count)
+        ]
+
+    def summary(self, metric: str) -> tuple[float, float, float] | None:
+        """The minimum, maximum and 95th percentile of a metric, None if it has no samples"""
+        values = sorted(value for value in self.values(metric) if not math.isnan(value))
+        if not values:
+            return None
+        return values[0], values[-1], values[max(math.ceil(len(values) * 0.95) - 1, 0)]
+
+    def sparkline(self, metric: str, width: int = 16) -> str:
+        """Draw the samples of a metric as a line of block characters, each one the maximum of its bucket"""
+        values = self.values(metric)
+        if not values:
+            return ""
+        count = min(width, len(values))
+        buckets = []
+        for bucket in range(count):
+            chunk = values[bucket * len(values) // count : (bucket + 1) * len(values) // count]
+            chunk = [value for value in chunk if not math.isnan(value)]
+            buckets.append(max(chunk) if chunk else math.nan)
+        known = [value for value in buckets if not math.isnan(value)]
+        if not known:
+            return " " * len(buckets)
+        low, high = min(known), max(known)
+        scale = (len(_SPARK_BLOCKS) - 1) / (high - low) if high > low else 0
+        return "".join(" " if math.isnan(value) else _SPARK_BLOCKS[round((value - low) * scale)] for value in buckets)
+
+
+class NodeStatsRecorder:
+    """Samples the stats of every PyLav node every ``interval`` seconds, keeping the last ``hours`` of them"""
+
+    __slots__ = ("interval", "hours", "_histories", "_task", "_started")
+
+    def __init__(self, interval: float = 60.0, hours: float = 6.0) -> None:
+        self.interval = interval
+        self.hours = hours
+        self._histories: dict[int, NodeStatsHistory] = {}
+        self._task: asyncio.Task | None = None
+        self._started = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return max(int(self.hours * 3600 // self.interval), 1)
+
+    def get(self, node: Node) -> NodeStatsHistory | None:
+        return self._histories.get(node.identifier)
+
+    def record(self, nodes: list[Node]) -> None:
+        for node in nodes:
+            if (history := self._histories.get(node.identifier)) is None:
+                history = self._histories[node.identifier] = NodeStatsHistory(self.capacity)
+            history.record(node)
+
+    async def _run(self, client: Client) -> None:
+        while True:
+            try:
+                self.record(client.node_manager.nodes)
+            except Exception as exc:
+                LOGGER.debug("Failed to record node stats: %s", exc)
+            await asyncio.sleep(self.interval)
+
+    def start(self, client: Client) -> None:
+        """Start sampling, does nothing if it is already running"""
+        if self._task is None or self._task.done():
+            self._started = time.monotonic()
+            self._task = asyncio.create_task(self._run(client))
+
+    def stop(self) -> None:
+        """Stop sampling and forget every recorded sample"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._histories.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "nodes": len(self._histories),
+            "capacity": self.capacity,
+            "bytes": sum(history.nbytes for history in self._histories.values()),
+            "running_for": round(time.monotonic() - self._started, 1) if self._task else 0.0,
+        }
+
+
+NODE_STATS = NodeStatsRecorder()
+
+
+class NodeProbe:
+    """The result of probing a node with :func:`probe_node`, fields the node couldn't provide are None"""
+
+    __slots__ = ("identifier", "name", "connected", "latency", "penalty", "frames_lost", "error")
+
+    def __init__(
+        self,
+        identifier: int,
+        name: str,
+        connected: bool,
+        latency: float | None = None,
+        penalty: float | None = None,
+        frames_lost: float | None = None,
+        error: str | None = None,
+    ) -> None:
+        self.identifier = identifier
+        self.name = name
+        self.connected = connected
+        self.latency = latency
+        self.penalty = penalty
+        self.frames_lost = frames_lost
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<NodeProbe name={self.name!r} connected={self.connected} latency={self.latency} error={self.error!r}>"
+
+
+async def probe_node(node: Node, timeout: float = PROBE_TIMEOUT) -> NodeProbe:
+    """Time a REST request to the node and read its websocket state, penalty and frame loss.
+
+    The latency is the round trip of a request to ``/version`` in milliseconds.
+    """
+    probe = NodeProbe(node.identifier, node.name, bool(node.websocket and node.websocket.connected))
+    if stats := node.stats:
+        probe.penalty = node.penalty - 1
+        probe.frames_lost = (abs(stats.frames_deficit) + abs(stats.frames_nulled)) / (stats.frames_sent or 1) * 100
+    destination = f"{node.connection_protocol}://{node.host}:{node.port}/version"
+    start = time.perf_counter()
+    try:
+        async with node.session.get(
+            destination, headers={"Authorization": node.password}, timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as res:
+            await res.read()
+            if res.status == 200:
+                probe.latency = (time.perf_counter() - start) * 1000
+            else:
+                probe.error = _("HTTP {status}").format(status=res.status)
+    except asyncio.TimeoutError:
+        probe.error = _("Timed out")
+    except aiohttp.ClientError as exc:
+        probe.error = _("Connection failed ({error_type})").format(error_type=type(exc).__name__)
+    return probe
+
+
+async def probe_nodes(
+    nodes: list[Node], *, timeout: float = PROBE_TIMEOUT, limit: int = PROBE_CONCURRENCY
+) -> list[NodeProbe]:
+    """Probe every node concurrently, so probing them all takes about as long as the slowest one"""
+    return await bounded_gather((probe_node(node, timeout) for node in nodes), limit)
+
+
+def sort_probes(probes: list[NodeProbe], key: str) -> list[NodeProbe]:
+    """Sort probe results best first by one of :data:`PROBE_SORT_KEYS`, nodes missing that value go last"""
+    if key == "name":
+        return sorted(probes, key=lambda probe: (probe.name or "").lower())
+    return sorted(probes, key=lambda probe: (getattr(probe, key) is None, getattr(probe, key) or 0))
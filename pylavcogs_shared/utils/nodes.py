@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from red_commons.logging import getLogger
+
+from pylav.sql.models import NodeModel
+from pylav.sql.tables.nodes import NodeRow
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.nodes")
+
+
+class NodeMetadata:
+    """The columns of a node needed to offer it as an option, loaded in bulk by :func:`fetch_node_metadata`"""
+
+    __slots__ = ("id", "name", "ssl", "search_only")
+
+    def __init__(
+        self,
+        id: int,  # noqa
+        name: str = NodeRow.name.default,
+        ssl: bool = NodeRow.ssl.default,
+        search_only: bool = NodeRow.search_only.default,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.ssl = ssl
+        self.search_only = search_only
+
+
+async def fetch_node_metadata(nodes: Iterable[NodeModel]) -> dict[int, NodeMetadata]:
+    """Load the name, ssl and search-only flags of every node with a single query, keyed by id.
+
+    Nodes that aren't in the database get the same defaults :meth:`NodeModel.fetch_all` would return for them.
+    """
+    ids = list({node.id for node in nodes})
+    if not ids:
+        return {}
+    rows = await NodeRow.select(NodeRow.id, NodeRow.name, NodeRow.ssl, NodeRow.search_only).where(NodeRow.id.is_in(ids))
+    metadata = {row["id"]: NodeMetadata(**row) for row in rows}
+    for node_id in ids:
+        if node_id not in metadata:
+            metadata[node_id] = NodeMetadata(node_id)
+    return metadata
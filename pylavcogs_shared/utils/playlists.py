@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import io
+import re
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from pathlib import Path
+from typing import IO
+
+import discord
+import yaml
+from red_commons.logging import getLogger
+
+from pylav.sql.models import PlaylistModel
+from pylav.sql.tables.playlists import PlaylistRow
+from pylav.types import BotT
+
+from pylavcogs_shared.i18n import SharedTranslator
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.playlists")
+
+_ = SharedTranslator("PyLavShared", Path(__file__))
+
+BRACKETS: re.Pattern = re.compile(r"[\[\]]")
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# How many tracks are serialised and compressed at a time when exporting a playlist
+EXPORT_CHUNK_SIZE = 1000
+# Exports bigger than this are written to a temporary file rather than kept in memory
+EXPORT_SPOOL_SIZE = 8 * 1024 * 1024
+# Roughly how much gzip shrinks an export, which is almost entirely base64 tracks
+_GZIP_RATIO = 0.75
+# The libyaml emitter when PyYAML was built with it, it writes the same YAML many times faster
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+class PlaylistMetadata:
+    """The columns of a playlist needed to display it, loaded in bulk by :func:`fetch_playlist_metadata`.
+
+    The formatting methods are copies of :meth:`PlaylistModel.get_name_formatted`,
+    :meth:`PlaylistModel.get_author_name` and :meth:`PlaylistModel.get_scope_name` from ``pylav.sql.models``
+    which work on the loaded columns instead of querying the database, keep them in sync with PyLav.
+    """
+
+    __slots__ = ("id", "name", "url", "scope", "author", "size")
+
+    def __init__(
+        self,
+        id: int,  # noqa
+        name: str | None = PlaylistRow.name.default,
+        url: str | None = PlaylistRow.url.default,
+        scope: int | None = PlaylistRow.scope.default,
+        author: int | None = PlaylistRow.author.default,
+        size: int = 0,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.url = url
+        self.scope = scope
+        self.author = author
+        self.size = size or 0
+
+    # Mirrors pylav.sql.models.PlaylistModel.get_name_formatted
+    def get_name_formatted(self, with_url: bool = True, escape: bool = True) -> str:
+        name = BRACKETS.sub("", self.name or "").strip()
+        if escape:
+            name = discord.utils.escape_markdown(name)
+        if with_url and self.url and self.url.startswith("http"):
+            return f"**[{name}]({self.url})**"
+        return f"**{name}**"
+
+    # Mirrors pylav.sql.models.PlaylistModel.get_author_name
+    def get_author_name(self, bot: BotT, mention: bool = True) -> str:
+        if user := bot.get_user(self.author):
+            return f"{user.mention}" if mention else f"{user}"
+        return f"{self.author}"
+
+    # Mirrors pylav.sql.models.PlaylistModel.get_scope_name
+    def get_scope_name(self, bot: BotT, mention: bool = True, guild: discord.Guild = None) -> str:
+        if bot.user.id == self.scope:
+            return _("(Global) {user_name}").format(user_name=bot.user.mention if mention else bot.user)
+        elif scope_guild := bot.get_guild(self.scope):
+            return _("(Server) {guild_name}").format(guild_name=scope_guild.name)
+        elif guild and (channel := guild.get_channel_or_thread(self.scope)):
+            return _("(Channel) {channel}").format(channel=channel.mention if mention else channel.name)
+        elif (guild and (user := guild.get_member(self.scope))) or (user := bot.get_user(self.scope)):
+            return _("(User) {user_name}").format(user_name=user.mention if mention else user)
+        else:
+            return _("(Invalid) {scope}").format(scope=self.scope)
+
+
+async def fetch_playlist_metadata(playlists: Iterable[PlaylistModel]) -> dict[int, PlaylistMetadata]:
+    """Load the name, url, scope, author and track count of every playlist with a single query, keyed by id.
+
+    Playlists that aren't in the database get the same defaults :class:`PlaylistModel` would return for them.
+    """
+    ids = list({playlist.id for playlist in playlists})
+    if not ids:
+        return {}
+    # Raw SQL because piccolo can't express jsonb_array_length, this counts the tracks without loading them
+    rows = await PlaylistRow.raw(
+        "SELECT id, name, url, scope, author, jsonb_array_length(tracks) AS size FROM playlist WHERE id = ANY({});",
+        ids,
+    )
+    metadata = {row["id"]: PlaylistMetadata(**row) for row in rows}
+    for playlist_id in ids:
+        if playlist_id not in metadata:
+            metadata[playlist_id] = PlaylistMetadata(playlist_id)
+    return metadata
+
+
+def choose_export_codec(estimated_size: int, limit: int) -> str | None:
+    """Pick the compression for an export of roughly ``estimated_size`` bytes so it fits in ``limit``.
+
+    Nothing is compressed if it already fits, gzip is preferred as it's easier for users to decompress,
+    brotli is only used when gzip isn't expected to be enough and it is installed.
+    """
+    if estimated_size <= limit:
+        return None
+    if brotli is not None and estimated_size * _GZIP_RATIO > limit:
+        return "brotli"
+    return "gzip"
+
+
+class _BrotliWriter:
+    __slots__ = ("_fp", "_compressor")
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._fp = fp
+        self._compressor = brotli.Compressor()
+
+    def write(self, data: bytes) -> None:
+        self._fp.write(self._compressor.process(data))
+
+    def close(self) -> None:
+        self._fp.write(self._compressor.finish())
+
+
+def _write_export(fp: IO[bytes], header: bytes, tracks: list[str], codec: str | None, chunk_size: int) -> None:
+    if codec == "gzip":
+        out = gzip.GzipFile(fileobj=fp, mode="wb", compresslevel=9)
+    elif codec == "brotli":
+        out = _BrotliWriter(fp)
+    else:
+        out = fp
+    out.write(header)
+    if tracks:
+        out.write(b"tracks:\n")
+        for start in range(0, len(tracks), chunk_size):
+            out.write(
+                yaml.dump(
+                    tracks[start : start + chunk_size],
+                    Dumper=_YAML_DUMPER,
+                    default_flow_style=False,
+                    sort_keys=False,
+                    encoding="utf-8",
+                )
+            )
+    else:
+        out.write(b"tracks: []\n")
+    if out is not fp:
+        out.close()
+    fp.seek(0)
+
+
+@contextlib.asynccontextmanager
+async def export_playlist(
+    playlist: PlaylistModel, guild: discord.Guild, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[tuple[IO[bytes], str | None]]:
+    """Serialise a playlist to the same YAML as :meth:`PlaylistModel.to_yaml`, without blocking the event loop.
+
+    The tracks are serialised and compressed ``chunk_size`` at a time in a worker thread,
+    straight into a temporary file for big playlists, so the whole document is never held in memory twice.
+    Yields the file and the compression used, which is None, ``"gzip"`` or ``"brotli"``.
+    """
+    data = await playlist.fetch_all()
+    tracks = data.get("tracks") or []
+    header = yaml.dump(
+        {key: value for key, value in data.items() if key != "tracks"},
+        Dumper=_YAML_DUMPER,
+        default_flow_style=False,
+        sort_keys=False,
+        encoding="utf-8",
+    )
+    # Each track is written as "- <track>\n"
+    estimated_size = len(header) + sum(len(track) + 3 for track in tracks)
+    codec = choose_export_codec(estimated_size, guild.filesize_limit)
+    with (io.BytesIO() if estimated_size <= EXPORT_SPOOL_SIZE else tempfile.TemporaryFile()) as fp:
+        await asyncio.to_thread(_write_export, fp, header, tracks, codec, chunk_size)
+        yield fp, codec
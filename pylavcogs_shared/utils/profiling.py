@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import contextlib
+import time
+import tracemalloc
+from collections.abc import Iterator
+from typing import Any
+
+import psutil
+from red_commons.logging import getLogger
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.profiling")
+
+_PROCESS = psutil.Process()
+
+
+class StartupProfiler:
+    """Records how long each startup phase of a PyLav cog took.
+
+    Timings use a monotonic clock and the growth of the process' resident memory is always recorded.
+    The peak of Python allocations is also recorded if :mod:`tracemalloc` is already tracing,
+    as starting it here would slow down the very thing being measured.
+
+    Both memory figures are process-wide. The phases of different cogs can run at the same time,
+    in which case each one's figures include the others' allocations, so such phases are marked as overlapped
+    and the tracemalloc peak is only reset when no other phase is running.
+    """
+
+    __slots__ = ("_phases", "_running", "_started")
+
+    def __init__(self) -> None:
+        self._phases: dict[str, dict[str, dict[str, Any]]] = {}
+        self._running = 0
+        self._started = 0
+
+    @contextlib.contextmanager
+    def phase(self, cog_name: str, name: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        overlapped = self._running > 0
+        if tracing and not overlapped:
+            tracemalloc.reset_peak()
+        self._running += 1
+        self._started += 1
+        started = self._started
+        start_rss = _PROCESS.memory_info().rss
+        start_wall = time.time()
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            duration = time.perf_counter() - start
+            self._running -= 1
+            self._phases.setdefault(cog_name, {})[name] = {
+                "started_at": start_wall,
+                "duration": duration,
+                "rss_delta": _PROCESS.memory_info().rss - start_rss,
+                "peak_memory": tracemalloc.get_traced_memory()[1] if tracing else None,
+                "failed": failed,
+                # Another phase started while this one was running, or was already running when it started
+                "overlapped": overlapped or self._started != started,
+            }
+            LOGGER.trace("Startup phase %s of %s took %.4fs", name, cog_name, duration)
+
+    def forget(self, cog_name: str) -> None:
+        self._phases.pop(cog_name, None)
+
+    def report(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """A JSON serializable copy of the recorded phases, keyed by cog name then phase name"""
+        return {cog: {phase: dict(record) for phase, record in phases.items()} for cog, phases in self._phases.items()}
+
+
+STARTUP_PROFILER = StartupProfiler()
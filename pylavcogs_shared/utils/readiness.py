@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import heapq
+import time
+
+from red_commons.logging import getLogger
+
+from pylav.client import Client
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.readiness")
+
+# How many waiting commands are woken up at once, and how long to wait before waking up the next batch
+_RELEASE_BATCH = 25
+_RELEASE_INTERVAL = 0.25
+
+
+class ReadinessGate:
+    """An admission queue for commands invoked while the PyLav client is not ready yet.
+
+    Each guild may have up to ``max_pending`` commands waiting,
+    any further command is rejected straight away with :class:`asyncio.QueueFull`
+    rather than piling up until they all time out together.
+    Once the client is ready the waiting commands are released oldest-first, ``_RELEASE_BATCH`` of them
+    every ``_RELEASE_INTERVAL`` seconds, so they don't all start running in the same instant.
+    Commands invoked while there is still a backlog queue up behind it.
+    """
+
+    __slots__ = (
+        "max_pending",
+        "timeout",
+        "_pending",
+        "_release_task",
+        "admitted",
+        "rejected",
+        "timed_out",
+        "waited",
+        "total_wait",
+        "max_wait",
+    )
+
+    def __init__(self, max_pending: int = 25, timeout: float = 30.0) -> None:
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._pending: dict[int | None, collections.deque[tuple[float, asyncio.Future]]] = {}
+        self._release_task: asyncio.Task | None = None
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def depth(self, guild_id: int | None = None) -> int:
+        """The number of commands waiting in a guild, or in every guild if ``guild_id`` is None"""
+        if guild_id is None:
+            return sum(len(queue) for queue in self._pending.values())
+        return len(self._pending.get(guild_id, ()))
+
+    async def wait(self, client: Client, guild_id: int | None) -> None:
+        """Wait until the client is ready.
+
+        Raises:
+            asyncio.QueueFull: The guild already has ``max_pending`` commands waiting.
+            asyncio.TimeoutError: The client did not become ready within ``timeout`` seconds.
+        """
+        if client.ready.is_set() and not self._pending:
+            self.admitted += 1
+            return
+        queue = self._pending.setdefault(guild_id, collections.deque())
+        if len(queue) >= self.max_pending:
+            self.rejected += 1
+            raise asyncio.QueueFull
+        entry = (time.monotonic(), asyncio.get_running_loop().create_future())
+        queue.append(entry)
+        if self._release_task is None or self._release_task.done():
+            self._release_task = asyncio.create_task(self._release_when_ready(client))
+        try:
+            await asyncio.wait_for(entry[1], timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise
+        finally:
+            with contextlib.suppress(ValueError):
+                queue.remove(entry)
+            if not queue and self._pending.get(guild_id) is queue:
+                del self._pending[guild_id]
+        waited = time.monotonic() - entry[0]
+        self.admitted += 1
+        self.waited += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    async def _release_when_ready(self, client: Client) -> None:
+        while self._pending:
+            await client.ready.wait()
+            entries = heapq.nsmallest(
+                _RELEASE_BATCH,
+                ((entry, guild_id) for guild_id, queue in self._pending.items() for entry in queue),
+                key=lambda item: item[0][0],
+            )
+            LOGGER.debug("PyLav is ready, releasing %s of %s waiting commands", len(entries), self.depth())
+            for entry, guild_id in entries:
+                queue = self._pending[guild_id]
+                queue.remove(entry)
+                if not queue:
+                    del self._pending[guild_id]
+                if not entry[1].done():
+                    entry[1].set_result(None)
+            if self._pending:
+                await asyncio.sleep(_RELEASE_INTERVAL)
+
+    def close(self) -> None:
+        """Stop releasing commands, cancelling any that are still waiting"""
+        if self._release_task is not None:
+            self._release_task.cancel()
+            self._release_task = None
+        for queue in self._pending.values():
+            for __, future in queue:
+                future.cancel()
+        self._pending.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "pending": self.depth(),
+            "pending_guilds": len(self._pending),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "average_wait": round(self.total_wait / self.waited, 4) if self.waited else 0.0,
+            "max_wait": round(self.max_wait, 4),
+        }
+
+
+READINESS_GATE = ReadinessGate()
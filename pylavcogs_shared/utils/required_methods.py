@@ -3,17 +3,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import inspect
+import io
+import json
 import threading
+from collections.abc import Iterable
 from pathlib import Path
 from types import MethodType
 
-import asyncstdlib
 import discord
 from discord.ext.commands import CheckFailure
 from red_commons.logging import getLogger
 from redbot.core import commands
 from redbot.core.data_manager import cog_data_path
-from redbot.core.i18n import Translator
 from redbot.core.utils.chat_formatting import box
 from tabulate import tabulate
 
@@ -30,14 +31,123 @@ from pylavcogs_shared.errors import (
     NotDJError,
     UnauthorizedChannelError,
 )
+from pylavcogs_shared.i18n import SharedTranslator
+from pylavcogs_shared.utils.caching import (
+    attach_cache_listeners,
+    cache_stats,
+    detach_cache_listeners,
+    fetch_channel_lock,
+    locale_cached,
+)
+from pylavcogs_shared.utils.node_stats import NODE_STATS
+from pylavcogs_shared.utils.profiling import STARTUP_PROFILER
+from pylavcogs_shared.utils.readiness import READINESS_GATE
+from pylavcogs_shared.utils.tracks import shutdown_decode_pool
 
-_ = Translator("PyLavShared", Path(__file__))
+_ = SharedTranslator("PyLavShared", Path(__file__))
 _LOCK = threading.Lock()
 LOGGER = getLogger("red.3pt.PyLav-Shared.utils.overrides")
 
 INCOMPATIBLE_COGS = {}
 
 
+class IncompatibleCogRegistry:
+    """Keeps track of whether a cog known to be incompatible with PyLav is loaded.
+
+    The loaded state is computed once when the registry is attached to a bot,
+    after which it is kept up to date by the ``cog_add`` and ``cog_remove`` events,
+    so checking it on every command invocation is a single attribute read.
+    """
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._names: set[str] = set(names)
+        self._loaded: set[str] = set()
+        self._bot: BotT | None = None
+
+    @property
+    def incompatible_loaded(self) -> bool:
+        """Whether any incompatible cog is currently loaded"""
+        return bool(self._loaded)
+
+    @property
+    def loaded_cog(self) -> str | None:
+        """The name of one of the incompatible cogs currently loaded, if any"""
+        return next(iter(self._loaded), None)
+
+    def attach(self, bot: BotT) -> None:
+        if self._bot is bot:
+            return
+        self.detach()
+        self._bot = bot
+        self._loaded = {name for name in self._names if bot.get_cog(name) is not None}
+        bot.add_listener(self._on_cog_add, "on_cog_add")
+        bot.add_listener(self._on_cog_remove, "on_cog_remove")
+
+    def detach(self) -> None:
+        if self._bot is None:
+            return
+        self._bot.remove_listener(self._on_cog_add, "on_cog_add")
+        self._bot.remove_listener(self._on_cog_remove, "on_cog_remove")
+        self._bot = None
+        self._loaded.clear()
+
+    def register(self, *names: str) -> None:
+        """Mark additional cog names as incompatible with PyLav"""
+        for name in names:
+            self._names.add(name)
+            if self._bot is not None and self._bot.get_cog(name) is not None:
+                self._loaded.add(name)
+
+    def unregister(self, *names: str) -> None:
+        """Stop treating the given cog names as incompatible with PyLav"""
+        for name in names:
+            self._names.discard(name)
+            self._loaded.discard(name)
+
+    async def _on_cog_add(self, cog: commands.Cog) -> None:
+        if cog.qualified_name in self._names:
+            self._loaded.add(cog.qualified_name)
+
+    async def _on_cog_remove(self, cog: commands.Cog) -> None:
+        self._loaded.discard(cog.qualified_name)
+
+
+INCOMPATIBLE_COG_REGISTRY = IncompatibleCogRegistry(INCOMPATIBLE_COGS)
+
+_SHARED_CLIENT: Client | None = None
+_REGISTERED_COGS: set[str] = set()
+
+
+def get_shared_client(bot: BotT, cog: CogT) -> Client:
+    """Get the process-wide PyLav client, only creating one if none is alive for this bot.
+
+    Every cog set up via :func:`pylav_auto_setup` is attached to the same client,
+    the client is only torn down when the last of them is unloaded.
+    A cog only counts towards that once it has been added to the bot, see :func:`_register_shared_client`.
+    """
+    global _SHARED_CLIENT
+    client = _SHARED_CLIENT or getattr(bot, "lavalink", None)
+    if not (isinstance(client, Client) and client.bot is bot and not client.is_shutting_down):
+        client = Client(bot=bot, cog=cog, config_folder=cog_data_path(raw_name="PyLav"))
+    _SHARED_CLIENT = client
+    return client
+
+
+def _register_shared_client(cog: CogT) -> None:
+    """Count the cog as a user of the shared client, only call this once it has been added to the bot"""
+    _REGISTERED_COGS.add(cog.__cog_name__)
+
+
+def _release_shared_client(cog: CogT) -> bool:
+    """Drop the cog's reference to the shared client, returns True if it was the last one"""
+    global _SHARED_CLIENT
+    _REGISTERED_COGS.discard(cog.__cog_name__)
+    if _REGISTERED_COGS:
+        return False
+    _SHARED_CLIENT = None
+    return True
+
+
 @commands.command(
     cls=commands.commands._AlwaysAvailableCommand,
     name="plcredits",
@@ -72,6 +182,36 @@ async def pylav_credits(context: PyLavContext) -> None:
     )
 
 
+@locale_cached
+def _version_headers() -> tuple[str, str]:
+    return (
+        EightBitANSI.paint_yellow(_("Library"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Version"), bold=True, underline=True),
+    )
+
+
+@locale_cached
+def _startup_headers() -> tuple[str, str, str, str, str]:
+    return (
+        EightBitANSI.paint_yellow(_("Cog"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Phase"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Time (ms)"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Process RSS Growth (KiB)"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Process Peak Memory (KiB)"), bold=True, underline=True),
+    )
+
+
+@locale_cached
+def _cache_headers() -> tuple[str, str, str, str, str]:
+    return (
+        EightBitANSI.paint_yellow(_("Cache"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Size"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Hits"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Misses"), bold=True, underline=True),
+        EightBitANSI.paint_yellow(_("Hit Rate"), bold=True, underline=True),
+    )
+
+
 @commands.command(
     cls=commands.commands._AlwaysAvailableCommand,
     name="plversion",
@@ -94,10 +234,7 @@ async def pylav_version(context: PyLavContext) -> None:
             description=box(
                 tabulate(
                     data,
-                    headers=(
-                        EightBitANSI.paint_yellow(_("Library"), bold=True, underline=True),
-                        EightBitANSI.paint_yellow(_("Version"), bold=True, underline=True),
-                    ),
+                    headers=_version_headers(),
                     tablefmt="fancy_grid",
                 ),
                 lang="ansi",
@@ -131,6 +268,121 @@ async def pylav_sync_slash(context: PyLavContext) -> None:
     )
 
 
+@commands.command(
+    cls=commands.commands._AlwaysAvailableCommand,
+    name="plstartup",
+    i18n=_,
+)
+@commands.is_owner()
+async def pylav_startup(context: PyLavContext, as_json: bool = False) -> None:
+    """Show how long each startup phase of the PyLav cogs took and how many commands waited for PyLav"""
+    if isinstance(context, discord.Interaction):
+        context = await context.client.get_context(context)
+    if context.interaction and not context.interaction.response.is_done():
+        await context.defer(ephemeral=True)
+    report = STARTUP_PROFILER.report()
+    readiness = READINESS_GATE.stats()
+    if as_json:
+        await context.send(
+            file=discord.File(
+                filename="pylav_startup.json",
+                fp=io.BytesIO(json.dumps({"phases": report, "readiness": readiness}, indent=2).encode("utf-8")),
+            ),
+            ephemeral=True,
+        )
+        return
+    data = [
+        (
+            EightBitANSI.paint_white(cog),
+            EightBitANSI.paint_white(phase),
+            EightBitANSI.paint_red(f"{record['duration'] * 1000:.2f}")
+            if record["failed"]
+            else EightBitANSI.paint_blue(f"{record['duration'] * 1000:.2f}"),
+            EightBitANSI.paint_blue(f"{record['rss_delta'] / 1024:.1f}{'*' if record['overlapped'] else ''}"),
+            EightBitANSI.paint_blue(
+                f"{record['peak_memory'] / 1024:.1f}{'*' if record['overlapped'] else ''}"
+                if record["peak_memory"] is not None
+                else "-"
+            ),
+        )
+        for cog, phases in report.items()
+        for phase, record in phases.items()
+    ]
+    embed = await context.lavalink.construct_embed(
+        description=box(
+            tabulate(
+                data,
+                headers=_startup_headers(),
+                tablefmt="fancy_grid",
+            ),
+            lang="ansi",
+        )
+        if data
+        else _("No startup timings have been recorded"),
+        messageable=context,
+    )
+    footer = _(
+        "Commands waiting for PyLav: {pending} | Admitted: {admitted} | Rejected: {rejected} | "
+        "Timed out: {timed_out} | Average wait: {average_wait}s | Longest wait: {max_wait}s"
+    ).format(**readiness)
+    if any(record["overlapped"] for phases in report.values() for record in phases.values()):
+        footer += "\n" + _(
+            "* Memory is measured for the whole process, "
+            "these phases ran alongside others so their figures include those phases' allocations"
+        )
+    embed.set_footer(text=footer)
+    await context.send(embed=embed, ephemeral=True)
+
+
+@commands.command(
+    cls=commands.commands._AlwaysAvailableCommand,
+    name="plcache",
+    i18n=_,
+)
+@commands.is_owner()
+async def pylav_cache(context: PyLavContext, as_json: bool = False) -> None:
+    """Show the size and hit rate of the caches shared by the PyLav cogs"""
+    if isinstance(context, discord.Interaction):
+        context = await context.client.get_context(context)
+    if context.interaction and not context.interaction.response.is_done():
+        await context.defer(ephemeral=True)
+    report = cache_stats()
+    if as_json:
+        await context.send(
+            file=discord.File(
+                filename="pylav_cache.json",
+                fp=io.BytesIO(json.dumps(report, indent=2).encode("utf-8")),
+            ),
+            ephemeral=True,
+        )
+        return
+    data = [
+        (
+            EightBitANSI.paint_white(name),
+            EightBitANSI.paint_blue(f"{stats['size']}/{stats['maxsize']}"),
+            EightBitANSI.paint_blue(stats["hits"]),
+            EightBitANSI.paint_blue(stats["misses"]),
+            EightBitANSI.paint_blue(f"{stats['hit_rate']:.1%}"),
+        )
+        for name, stats in report.items()
+        if "hit_rate" in stats
+    ]
+    await context.send(
+        embed=await context.lavalink.construct_embed(
+            description=box(
+                tabulate(
+                    data,
+                    headers=_cache_headers(),
+                    tablefmt="fancy_grid",
+                ),
+                lang="ansi",
+            ),
+            messageable=context,
+        ),
+        ephemeral=True,
+    )
+
+
 def _done_callback(task: asyncio.Task) -> None:
     with contextlib.suppress(asyncio.CancelledError):
         exc = task.exception()
@@ -207,26 +459,51 @@ async def cog_command_error(self: CogT, context: PyLavContext, error: Exception)
             return await self.bot.on_command_error(context, error, unhandled_by_cog=True)  # type: ignore
 
 
+def _teardown_shared_state(bot: BotT) -> None:
+    """Remove the shared commands, listeners and background work once no PyLav cog is left"""
+    bot.remove_command(pylav_credits.qualified_name)
+    bot.remove_command(pylav_version.qualified_name)
+    bot.remove_command(pylav_sync_slash.qualified_name)
+    bot.remove_command(pylav_startup.qualified_name)
+    bot.remove_command(pylav_cache.qualified_name)
+    INCOMPATIBLE_COG_REGISTRY.detach()
+    detach_cache_listeners()
+    READINESS_GATE.close()
+    shutdown_decode_pool()
+    NODE_STATS.stop()
+
+
 async def cog_unload(self: CogT) -> None:
     if self._init_task is not None:
         self._init_task.cancel()
     client = self.lavalink
     await client.unregister(cog=self)
-    if client._shutting_down:
-        self.bot.remove_command(pylav_credits.qualified_name)
-        self.bot.remove_command(pylav_version.qualified_name)
+    if _release_shared_client(self) or client.is_shutting_down:
+        _teardown_shared_state(self.bot)
+    STARTUP_PROFILER.forget(self.__cog_name__)
     if meth := getattr(self, "__pylav_original_cog_unload", None):
         return await discord.utils.maybe_coroutine(meth)
 
 
 async def cog_before_invoke(self: CogT, context: PyLavContext):
     try:
-        await self.lavalink.wait_until_ready(timeout=30)
+        await READINESS_GATE.wait(self.lavalink, context.guild.id if context.guild else None)
+    except asyncio.QueueFull as e:
+        LOGGER.verbose(
+            "Rejected command due to too many commands waiting for PyLav to be ready - Guild: %s - Command: %s",
+            context.guild,
+            context.command.qualified_name,
+        )
+
+        raise CheckFailure(
+            _("PyLav is still starting up and too many commands are waiting - Please try again in a few seconds")
+        ) from e
     except asyncio.TimeoutError as e:
-        LOGGER.debug("Discarded command due to PyLav not being ready within 30 seconds")
+        LOGGER.debug("Discarded command due to PyLav not being ready within %s seconds", READINESS_GATE.timeout)
 
         LOGGER.verbose(
-            "Discarded command due to PyLav not being ready within 30 seconds - Guild: %s - Command: %s",
+            "Discarded command due to PyLav not being ready within %s seconds - Guild: %s - Command: %s",
+            READINESS_GATE.timeout,
             context.guild,
             context.command.qualified_name,
         )
@@ -238,18 +515,21 @@ async def cog_before_invoke(self: CogT, context: PyLavContext):
 
 async def initialize(self: CogT, *args, **kwargs) -> None:
     if not self.init_called:
-        await self.lavalink.register(self)
-        await self.lavalink.initialize()
+        with STARTUP_PROFILER.phase(self.__cog_name__, "lavalink.register"):
+            await self.lavalink.register(self)
+        with STARTUP_PROFILER.phase(self.__cog_name__, "lavalink.initialize"):
+            await self.lavalink.initialize()
         self.init_called = True
     if meth := getattr(self, "__pylav_original_initialize", None):
-        return await discord.utils.maybe_coroutine(meth, *args, **kwargs)
+        with STARTUP_PROFILER.phase(self.__cog_name__, "initialize"):
+            return await discord.utils.maybe_coroutine(meth, *args, **kwargs)
 
 
 async def cog_check(self: CogT, context: PyLavContext) -> bool:
 
     # This cog mock discord objects and sends them on the listener
     #   Due to the potential risk for unexpected behaviour - disabled all commands if this cog is loaded.
-    if await asyncstdlib.any(context.bot.get_cog(name) is not None for name in INCOMPATIBLE_COGS):
+    if INCOMPATIBLE_COG_REGISTRY.incompatible_loaded:
         return False
     if not (getattr(context.bot, "lavalink", None)):
         return False
@@ -261,7 +541,7 @@ async def cog_check(self: CogT, context: PyLavContext) -> bool:
     else:
         config = context.bot.lavalink.player_config_manager.get_config(context.guild.id)
 
-    if (channel_id := await config.fetch_text_channel_id()) != 0 and channel_id != context.channel.id:
+    if (channel_id := await fetch_channel_lock(context.guild.id, config)) != 0 and channel_id != context.channel.id:
         return False
     return await discord.utils.maybe_coroutine(meth, context) if meth else True
 
@@ -286,6 +566,10 @@ def class_factory(
         bot.add_command(pylav_version)
     if not bot.get_command(pylav_sync_slash.qualified_name):
         bot.add_command(pylav_sync_slash)
+    if not bot.get_command(pylav_startup.qualified_name):
+        bot.add_command(pylav_startup)
+    if not bot.get_command(pylav_cache.qualified_name):
+        bot.add_command(pylav_cache)
     argspec = inspect.getfullargspec(cls.__init__)
     if ("bot" in argspec.args or "bot" in argspec.kwonlyargs) and bot not in cogargs:
         cogkwargs["bot"] = bot
@@ -293,7 +577,7 @@ def class_factory(
     cog_instance = cls(*cogargs, **cogkwargs)
     if not hasattr(cog_instance, "__version__"):
         cog_instance.__version__ = "0.0.0"
-    cog_instance.lavalink = Client(bot=bot, cog=cog_instance, config_folder=cog_data_path(raw_name="PyLav"))
+    cog_instance.lavalink = get_shared_client(bot, cog_instance)
     cog_instance.bot = bot
     cog_instance.init_called = False
     cog_instance._init_task = cls.cog_check
@@ -334,11 +618,13 @@ async def pylav_auto_setup(
     """Injects all the methods and attributes to respect PyLav Settings and keep the user experience consistent.
 
     Adds `.bot` attribute to the cog instance.
-    Adds `.lavalink` attribute to the cog instance and starts up PyLav
+    Adds `.lavalink` attribute to the cog instance and starts up PyLav,
+        every cog loaded this way shares a single client which is shut down once the last of them is unloaded.
     Overwrites cog_unload method to unregister the cog from Lavalink,
         calling the original cog_unload method once the PyLav unregister code is run.
     Overwrites cog_before_invoke
-        To force commands to wait for PyLav to be ready
+        To force commands to wait for PyLav to be ready,
+        commands are rejected straight away if too many are already waiting in the same guild.
     Overwrites cog_check method to check if the cog is allowed to run in the current context,
         If called within a Guild then we check if we can run as per the PyLav Command channel lock,
         if this check passes then the original cog_check method is called.
@@ -347,6 +633,7 @@ async def pylav_auto_setup(
         this will still be called after the built-in PyLav error handling if the error raised was unhandled.
     Overwrites initialize method to handle PyLav startup,
         calling the original initialize method once the PyLav initialization code is run, if such method exists. code is run.
+    Records the time taken by each startup phase, which can be viewed with the `plstartup` command.
 
 
     Args:
@@ -373,9 +660,13 @@ async def pylav_auto_setup(
         ...     await pylav_auto_setup(bot, MyCogClass, cogargs=(), cogkwargs=dict(special_arg=42), initargs=(), initkwargs=dict())
 
     """
-    if await asyncstdlib.any(bot.get_cog(name) is not None for name in INCOMPATIBLE_COGS if (_name := name)):
+    INCOMPATIBLE_COG_REGISTRY.attach(bot)
+    if name := INCOMPATIBLE_COG_REGISTRY.loaded_cog:
+        if not _REGISTERED_COGS:
+            # No other PyLav cog is loaded, so don't leave the registry attached for a cog that never loaded
+            INCOMPATIBLE_COG_REGISTRY.detach()
         raise IncompatibleException(
-            f"{_name} is loaded, this cog is incompatible with PyLav - PyLav will not work as long as this cog is loaded"
+            f"{name} is loaded, this cog is incompatible with PyLav - PyLav will not work as long as this cog is loaded"
         )
     if cogargs is None:
         cogargs = ()
@@ -386,8 +677,20 @@ async def pylav_auto_setup(
     if initkwargs is None:
         initkwargs = {}
     with _LOCK:
-        cog_instance = class_factory(bot, cog_cls, cogargs, cogkwargs)
-        await bot.add_cog(cog_instance)
+        try:
+            with STARTUP_PROFILER.phase(cog_cls.__cog_name__, "class_factory"):
+                cog_instance = class_factory(bot, cog_cls, cogargs, cogkwargs)
+            with STARTUP_PROFILER.phase(cog_cls.__cog_name__, "bot.add_cog"):
+                await bot.add_cog(cog_instance)
+        except Exception:
+            if not _REGISTERED_COGS:
+                # No other PyLav cog is loaded, so undo the shared setup done for this one
+                _teardown_shared_state(bot)
+            raise
+        _register_shared_client(cog_instance)
+    # Attached once the client exists, as the names of PyLav's events are read from it
+    attach_cache_listeners(bot, cog_instance.lavalink)
+    NODE_STATS.start(cog_instance.lavalink)
     cog_instance._init_task = asyncio.create_task(cog_instance.initialize(*initargs, **initkwargs))
     cog_instance._init_task.add_done_callback(_done_callback)
     return cog_instance
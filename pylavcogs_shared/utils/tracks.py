@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import multiprocessing
+import os
+import re
+import struct
+from collections.abc import AsyncIterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import PurePath
+
+from red_commons.logging import getLogger
+
+LOGGER = getLogger("red.3pt.PyLav-Shared.utils.tracks")
+
+SQUARE_BRACKETS: re.Pattern = re.compile(r"[\[\]]")
+
+_INT = struct.Struct(">i")
+_LONG = struct.Struct(">Q")
+_SHORT = struct.Struct(">H")
+
+# Lists of tracks shorter than this are decoded on the event loop, as sending them to another process costs more
+BULK_DECODE_THRESHOLD = 2000
+BULK_DECODE_CHUNK_SIZE = 500
+_DECODE_WORKERS = min(4, os.cpu_count() or 1)
+
+_DECODE_POOL: ProcessPoolExecutor | None = None
+
+
+class TrackMetadata:
+    """The details of a track needed to display it, decoded straight from its base64 string.
+
+    Unlike :class:`pylav.tracks.Track` this doesn't need a node, a query or an event loop,
+    so it can be used to render tracks that aren't going to be played, such as the contents of a playlist.
+    """
+
+    __slots__ = ("encoded", "title", "author", "duration", "identifier", "stream", "uri", "source")
+
+    def __init__(
+        self,
+        encoded: str,
+        title: str,
+        author: str,
+        duration: int,
+        identifier: str,
+        stream: bool,
+        uri: str | None,
+        source: str,
+    ) -> None:
+        self.encoded = encoded
+        self.title = title
+        self.author = author
+        self.duration = duration
+        self.identifier = identifier
+        self.stream = stream
+        self.uri = uri
+        self.source = source
+
+    def __reduce__(self) -> tuple[type[TrackMetadata], tuple]:
+        # Much cheaper to unpickle than the default state dict, which matters when they come back from the decode pool
+        return TrackMetadata, (
+            self.encoded,
+            self.title,
+            self.author,
+            self.duration,
+            self.identifier,
+            self.stream,
+            self.uri,
+            self.source,
+        )
+
+    def __repr__(self) -> str:
+        return f"<TrackMetadata title={self.title!r} author={self.author!r} source={self.source!r}>"
+
+    def get_track_display_name(
+        self,
+        max_length: int = None,
+        author: bool = True,
+        unformatted: bool = False,
+        with_url: bool = False,
+        escape: bool = True,
+    ) -> str:
+        """Render the track the same way :meth:`pylav.tracks.Track.get_track_display_name` does.
+
+        Streams are shown by their title rather than their current ICY title, as that needs a connection.
+        """
+        length_to_trim = 7
+        if unformatted:
+            bold = url_start = url_end = ""
+            length_to_trim = 3
+        elif with_url and self.uri:
+            bold, url_start, url_end = "**", "[", f"]({self.uri})"
+        else:
+            bold, url_start, url_end = "**", "", ""
+        if max_length:
+            max_length -= length_to_trim
+        author_string = f" - {self.author}" if author else ""
+        if self.source == "local":
+            url_start = url_end = ""
+            if self.title != "Unknown title" or self.author != "Unknown artist":
+                base = SQUARE_BRACKETS.sub("", f"{self.title}{author_string}").strip()
+            else:
+                base = SQUARE_BRACKETS.sub("", PurePath(self.uri or self.identifier).name).strip()
+            if max_length and len(base) > max_length:
+                base = "\N{HORIZONTAL ELLIPSIS}" + base[-max_length:]
+        else:
+            if self.stream or self.author.lower() not in self.title.lower():
+                base = f"{self.title}{author_string}"
+            else:
+                base = self.title
+            base = SQUARE_BRACKETS.sub("", base).strip()
+            if max_length and len(base) > max_length:
+                base = base[:max_length] + "\N{HORIZONTAL ELLIPSIS}"
+        if escape:
+            from discord.utils import escape_markdown
+
+            base = escape_markdown(base)
+        return f"{bold}{url_start}{base}{url_end}{bold}"
+
+
+# Raised by decode_track_metadata for tracks it can't read, binascii.Error and UnicodeError are both ValueErrors
+TRACK_DECODE_ERRORS = (ValueError, struct.error, IndexError)
+# The newest track format decode_track_metadata understands, this is the version lavaplayer's encoder writes
+_TRACK_VERSION = 3
+
+
+def _read_string(data: bytes, offset: int) -> tuple[str, int]:
+    """Read a string written by Java's ``DataOutput.writeUTF``, which is modified UTF-8 prefixed by its length"""
+    (length,) = _SHORT.unpack_from(data, offset)
+    offset += 2
+    raw = data[offset : offset + length]
+    if len(raw) != length:
+        raise ValueError("Track data ends in the middle of a string")
+    # Modified UTF-8 only differs from UTF-8 for NUL and characters outside the BMP,
+    # both of which fail to decode as UTF-8, so those rare strings take the slow path
+    try:
+        return raw.decode("utf-8"), offset + length
+    except UnicodeDecodeError:
+        return _read_utfm(raw), offset + length
+
+
+def _read_utfm(raw: bytes) -> str:
+    """Decode modified UTF-8 the same way :func:`pylav.track_encoding.read_utfm` does.
+
+    Kept free of pylav, as the decode pool's workers import this module and importing pylav connects to its database.
+    """
+    # NUL is written as two bytes and characters outside the BMP as the UTF-8 of their UTF-16 surrogate pair
+    chars = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+    return chars.encode("utf-16", "surrogatepass").decode("utf-16")
+
+
+def _read_nullable_string(data: bytes, offset: int) -> tuple[str | None, int]:
+    if data[offset]:
+        return _read_string(data, offset + 1)
+    return None, offset + 1
+
+
+def decode_track_metadata(encoded: str) -> TrackMetadata:
+    """Decode a Lavalink base64 track into a :class:`TrackMetadata` without going through a node.
+
+    Follows lavaplayer's ``decodeTrack`` for versions 1 to 3 of the format, anything else raises one of
+    :data:`TRACK_DECODE_ERRORS`, so the caller can fall back to building a :class:`pylav.tracks.Track`.
+    """
+    data = base64.b64decode(encoded)
+    (header,) = _INT.unpack_from(data, 0)
+    if (header >> 30) & 1:
+        version, offset = data[4], 5
+    else:
+        version, offset = 1, 4
+    if version > _TRACK_VERSION:
+        raise ValueError(f"Unsupported track version {version}")
+    title, offset = _read_string(data, offset)
+    author, offset = _read_string(data, offset)
+    (duration,) = _LONG.unpack_from(data, offset)
+    identifier, offset = _read_string(data, offset + 8)
+    stream = data[offset] != 0
+    offset += 1
+    uri = None
+    if version >= 2:
+        uri, offset = _read_nullable_string(data, offset)
+    if version >= 3:
+        # The artwork url and ISRC, neither of which is displayed
+        _, offset = _read_nullable_string(data, offset)
+        _, offset = _read_nullable_string(data, offset)
+    source, offset = _read_string(data, offset)
+    return TrackMetadata(encoded, title, author, duration, identifier, stream, uri, source)
+
+
+def _decode_chunk(tracks: Sequence[str]) -> list[TrackMetadata | None]:
+    decoded = []
+    for track in tracks:
+        try:
+            decoded.append(decode_track_metadata(track))
+        except TRACK_DECODE_ERRORS:
+            decoded.append(None)
+    return decoded
+
+
+def _get_decode_pool() -> ProcessPoolExecutor:
+    global _DECODE_POOL
+    if _DECODE_POOL is None:
+        # Forking would copy the bot's event loop, sockets and locks into the workers, spawn starts them clean
+        _DECODE_POOL = ProcessPoolExecutor(max_workers=_DECODE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    return _DECODE_POOL
+
+
+def shutdown_decode_pool() -> None:
+    """Stop the worker processes used by :func:`decode_tracks`, they are started again when next needed"""
+    global _DECODE_POOL
+    if _DECODE_POOL is not None:
+        _DECODE_POOL.shutdown(wait=False, cancel_futures=True)
+        _DECODE_POOL = None
+
+
+def _discard_broken_pool(pool: ProcessPoolExecutor) -> None:
+    global _DECODE_POOL
+    # Another call may have already replaced the broken pool, which must be left running
+    if pool is _DECODE_POOL:
+        _DECODE_POOL = None
+    # A broken pool fails all of its futures itself, cancelling them as well races with it and leaves it hanging
+    pool.shutdown(wait=False)
+
+
+async def _decode_inline(tracks: Sequence[str], chunk_size: int) -> AsyncIterator[TrackMetadata]:
+    for start in range(0, len(tracks), chunk_size):
+        for track in _decode_chunk(tracks[start : start + chunk_size]):
+            if track is not None:
+                yield track
+        await asyncio.sleep(0)
+
+
+async def decode_tracks(
+    tracks: Sequence[str],
+    *,
+    chunk_size: int = BULK_DECODE_CHUNK_SIZE,
+    threshold: int = BULK_DECODE_THRESHOLD,
+) -> AsyncIterator[TrackMetadata]:
+    """Decode a list of base64 tracks, yielding them in order as they are decoded.
+
+    Lists with at least ``threshold`` tracks are decoded in chunks by a pool of worker processes if there's more
+    than one CPU, otherwise they are decoded chunk by chunk on the event loop, yielding to it between chunks.
+    If a worker dies the rest of the list is decoded on the event loop and the pool is replaced on the next call.
+    Tracks that can't be decoded are skipped.
+    """
+    # With a single CPU a worker only competes with the event loop for it, so decoding inline is as responsive
+    if len(tracks) < threshold or _DECODE_WORKERS < 2:
+        async for track in _decode_inline(tracks, chunk_size):
+            yield track
+        return
+    loop = asyncio.get_running_loop()
+    pool = _get_decode_pool()
+    pending: collections.deque[asyncio.Future[list[TrackMetadata | None]]] = collections.deque()
+    chunks = iter(range(0, len(tracks), chunk_size))
+    # Everything before this index has been yielded
+    decoded_until = 0
+    try:
+        # Only keep a couple of chunks per worker in flight, so an abandoned iteration doesn't decode everything
+        for start in chunks:
+            pending.append(loop.run_in_executor(pool, _decode_chunk, tracks[start : start + chunk_size]))
+            if len(pending) >= _DECODE_WORKERS * 2:
+                break
+        while pending:
+            decoded = await pending.popleft()
+            if (start := next(chunks, None)) is not None:
+                pending.append(loop.run_in_executor(pool, _decode_chunk, tracks[start : start + chunk_size]))
+            for track in decoded:
+                if track is not None:
+                    yield track
+            decoded_until += chunk_size
+    except BrokenProcessPool:
+        LOGGER.warning(
+            "A track decoding worker died, decoding the remaining %s tracks inline", len(tracks) - decoded_until
+        )
+        await asyncio.gather(*pending, return_exceptions=True)
+        pending.clear()
+        _discard_broken_pool(pool)
+    else:
+        return
+    finally:
+        for future in pending:
+            future.cancel()
+    async for track in _decode_inline(tracks[decoded_until:], chunk_size):
+        yield track